@@ -1,38 +1,76 @@
 Import("env")
 import os
 import subprocess
+from pathlib import Path
+
+def read_git_head(project_dir):
+    """Resolve HEAD to a commit hash by reading .git directly, or return None."""
+    # Find the .git directory in the project directory or one of its parents
+    search_dir = Path(project_dir).resolve()
+    for candidate in (search_dir, *search_dir.parents):
+        git_dir = candidate / ".git"
+        if git_dir.exists():
+            break
+    else:
+        return None
+
+    # Worktrees and submodules use a .git file; leave those to git itself
+    if not git_dir.is_dir():
+        return None
+
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+        if not head.startswith("ref: "):
+            # Detached HEAD already contains the hash
+            return head or None
+
+        ref = head[len("ref: "):]
+        ref_path = git_dir / ref
+        if ref_path.is_file():
+            return ref_path.read_text().strip() or None
+
+        # Ref may only be present in packed-refs
+        packed_refs = git_dir / "packed-refs"
+        if packed_refs.is_file():
+            for line in packed_refs.read_text().splitlines():
+                parts = line.split(" ", 1)
+                if len(parts) == 2 and parts[1] == ref:
+                    return parts[0]
+    except OSError:
+        pass
+    return None
 
 def ensure_git_head_ref(build_dir):
     """Create git-data/head-ref file to prevent CMake git revision detection errors."""
     # Try to get actual git hash, fallback to dummy hash if git fails
     git_hash = "0000000000000000000000000000000000000000"
-    try:
-        project_dir = env.subst("$PROJECT_DIR")
-        result = subprocess.run(
-            ['git', 'rev-parse', 'HEAD'],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            git_hash = result.stdout.strip()
-    except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-        pass
+    project_dir = env.subst("$PROJECT_DIR")
+    head_hash = read_git_head(project_dir)
+    if head_hash:
+        git_hash = head_hash
+    else:
+        # Fall back to asking git when .git cannot be read directly
+        try:
+            result = subprocess.run(
+                ['git', 'rev-parse', 'HEAD'],
+                cwd=project_dir,
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
+            if result.returncode == 0 and result.stdout.strip():
+                git_hash = result.stdout.strip()
+        except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
+            pass
 
-    # Create git-data directory and head-ref file for main project
-    git_data_dir = os.path.join(build_dir, "CMakeFiles", "git-data")
-    os.makedirs(git_data_dir, exist_ok=True)
-    head_ref_path = os.path.join(git_data_dir, "head-ref")
-    with open(head_ref_path, "w") as f:
-        f.write(git_hash + "\n")
-
-    # Create git-data directory and head-ref file for bootloader subproject
-    bootloader_git_data_dir = os.path.join(build_dir, "bootloader", "CMakeFiles", "git-data")
-    os.makedirs(bootloader_git_data_dir, exist_ok=True)
-    bootloader_head_ref_path = os.path.join(bootloader_git_data_dir, "head-ref")
-    with open(bootloader_head_ref_path, "w") as f:
-        f.write(git_hash + "\n")
+    # Create git-data directory and head-ref file for main project and bootloader subproject
+    payload = (git_hash + "\n").encode("ascii")
+    for git_data_dir in (
+        os.path.join(build_dir, "CMakeFiles", "git-data"),
+        os.path.join(build_dir, "bootloader", "CMakeFiles", "git-data"),
+    ):
+        os.makedirs(git_data_dir, exist_ok=True)
+        Path(git_data_dir, "head-ref").write_bytes(payload)
 
 # Run before CMake configuration
 # BUILD_DIR might not exist yet, so we construct it from PROJECT_DIR
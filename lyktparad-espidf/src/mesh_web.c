@@ -987,7 +987,21 @@ static esp_err_t api_nodes_handler(httpd_req_t *req)
         return ESP_FAIL;
     }
 
+    /* ETag derived from the node count, so an unchanged count is answered with an empty 304 */
+    char etag[24];
+    snprintf(etag, sizeof(etag), "\"n%d\"", node_count);
+
+    char if_none_match[24];
+    if (httpd_req_get_hdr_value_str(req, "If-None-Match", if_none_match, sizeof(if_none_match)) == ESP_OK &&
+        strcmp(if_none_match, etag) == 0) {
+        httpd_resp_set_status(req, "304 Not Modified");
+        httpd_resp_set_hdr(req, "ETag", etag);
+        httpd_resp_set_hdr(req, "Access-Control-Allow-Origin", "*");
+        return httpd_resp_send(req, NULL, 0);
+    }
+
     httpd_resp_set_type(req, "application/json");
+    httpd_resp_set_hdr(req, "ETag", etag);
     httpd_resp_set_hdr(req, "Access-Control-Allow-Origin", "*");
     return httpd_resp_send(req, response, len);
 }
@@ -2,8 +2,9 @@
 """
 File to C String Converter
 
-Converts a file (HTML, JS, CSS) into a C string literal header file.
-The generated header contains a const char array with the file content.
+Converts a file (HTML, JS, CSS) into a C header file.
+The generated header contains a const char array with the UTF-8 file content,
+emitted as '\\xNN' character constants and terminated by a null byte.
 
 Copyright (c) 2025 the_louie
 
@@ -16,24 +17,87 @@ CONDITIONS OF ANY KIND, either express or implied.
 
 import sys
 import os
-import re
-
-def escape_c_string(content):
-    """Escape content for C string literal."""
-    # Escape backslashes first (before other escape sequences)
-    content = content.replace('\\', '\\\\')
-    # Escape double quotes
-    content = content.replace('"', '\\"')
-    # Escape newlines
-    content = content.replace('\n', '\\n')
-    # Escape carriage returns
-    content = content.replace('\r', '\\r')
-    # Escape tabs
-    content = content.replace('\t', '\\t')
-    # Check for null bytes (not allowed in C strings)
-    if '\x00' in content:
-        raise ValueError("File contains null bytes, cannot be converted to C string")
-    return content
+import mmap
+import codecs
+from concurrent.futures import ProcessPoolExecutor
+
+# Number of bytes per line in the generated array initializer
+_BYTES_PER_ROW = 16
+
+# Files larger than this are memory-mapped instead of read into a bytes object
+_MMAP_THRESHOLD = 64 * 1024
+
+# Number of input bytes converted and written at a time
+_CHUNK_SIZE = _BYTES_PER_ROW * 4096
+
+def format_c_char_rows(content):
+    """
+    Format bytes as newline-terminated rows of character constants for a C char array initializer.
+
+    Every byte is written as a '\\xNN' constant, which is a valid char value whether
+    char is signed or unsigned. Accepts any bytes-like object.
+    """
+    if not len(content):
+        return ''
+    # Hex-encode the whole buffer in one pass, so every byte becomes "'\xNN', ",
+    # then cut the text into fixed-width rows
+    hex_text = "'\\x" + content.hex(' ').replace(' ', "', '\\x") + "', "
+    row_width = len("'\\xNN', ") * _BYTES_PER_ROW
+    return ''.join('    ' + hex_text[offset:offset + row_width].rstrip() + '\n'
+                   for offset in range(0, len(hex_text), row_width))
+
+def iter_c_char_array_chunks(content):
+    """
+    Yield the C char array initializer for content as UTF-8, one chunk of rows at a time.
+
+    Invalid UTF-8 sequences are replaced with U+FFFD and a null terminator is appended
+    so the array can still be used as a C string. Content is converted _CHUNK_SIZE bytes
+    at a time, so a memoryview of an mmap is formatted in constant memory.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    # Re-encoded bytes not yet formatted because they do not fill a whole row
+    pending = b''
+    for offset in range(0, len(content), _CHUNK_SIZE):
+        pending += decoder.decode(content[offset:offset + _CHUNK_SIZE]).encode('utf-8')
+        rows_len = len(pending) - len(pending) % _BYTES_PER_ROW
+        yield format_c_char_rows(pending[:rows_len])
+        pending = pending[rows_len:]
+    pending += decoder.decode(b'', final=True).encode('utf-8')
+    yield format_c_char_rows(pending + b'\x00')
+
+# Generated header file text before and after the array initializer rows
+_HEADER_PROLOGUE_TEMPLATE = """/* Generated header file from {basename}
+ *
+ * This file was automatically generated. Do not edit manually.
+ * Source: {source}
+ *
+ * Copyright (c) 2025 the_louie
+ */
+
+#ifndef {header_guard}
+#define {header_guard}
+
+#include <stddef.h>
+
+/* Embedded {file_type_upper} content as null-terminated char array */
+static const char {var_name}[] = {{
+"""
+_HEADER_EPILOGUE_TEMPLATE = """}};
+static const size_t {size_var_name} = sizeof({var_name}) - 1;  /* Exclude null terminator */
+
+#endif /* {header_guard} */
+"""
+
+# Byte translation tables replacing every non-alphanumeric character with an underscore
+# while folding case, for building C identifiers in a single pass
+_ALNUM_BYTES = b'0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+_IDENT_UPPER_TABLE = bytes(c if c in _ALNUM_BYTES else ord('_') for c in range(256)).upper()
+_IDENT_LOWER_TABLE = bytes(c if c in _ALNUM_BYTES else ord('_') for c in range(256)).lower()
+
+def sanitize_identifier(name, table):
+    """Replace non-alphanumeric characters in name with underscores using a translation table."""
+    # Non-ASCII characters become '?' first, which the table then maps to '_'
+    return name.encode('ascii', 'replace').translate(table).decode('ascii')
 
 def generate_header_guard_name(file_path, file_type):
     """Generate header guard name from file path and type."""
@@ -43,7 +107,7 @@ def generate_header_guard_name(file_path, file_type):
     plugin_name = os.path.basename(dirname)
 
     # Convert to uppercase and replace special characters with underscores
-    plugin_name_upper = re.sub(r'[^a-zA-Z0-9]', '_', plugin_name).upper()
+    plugin_name_upper = sanitize_identifier(plugin_name, _IDENT_UPPER_TABLE)
     file_type_upper = file_type.upper()
 
     return f"PLUGIN_{plugin_name_upper}_{file_type_upper}_H"
@@ -55,7 +119,7 @@ def generate_variable_name(file_path, file_type):
     plugin_name = os.path.basename(dirname)
 
     # Convert to lowercase and replace special characters with underscores
-    plugin_name_lower = re.sub(r'[^a-zA-Z0-9]', '_', plugin_name).lower()
+    plugin_name_lower = sanitize_identifier(plugin_name, _IDENT_LOWER_TABLE)
     file_type_lower = file_type.lower()
 
     # Handle index.html specially
@@ -64,12 +128,38 @@ def generate_variable_name(file_path, file_type):
     else:
         # Remove extension from basename
         basename_noext = os.path.splitext(basename)[0]
-        basename_lower = re.sub(r'[^a-zA-Z0-9]', '_', basename_noext).lower()
+        basename_lower = sanitize_identifier(basename_noext, _IDENT_LOWER_TABLE)
         return f"plugin_{basename_lower}_{file_type_lower}"
 
+def is_output_up_to_date(input_file, output_file):
+    """Check whether output_file is newer than input_file and this converter script."""
+    try:
+        output_mtime = os.stat(output_file).st_mtime_ns
+    except OSError:
+        return False
+    input_mtime = os.stat(input_file).st_mtime_ns
+    script_mtime = os.stat(__file__).st_mtime_ns
+    return input_mtime <= output_mtime and script_mtime <= output_mtime
+
+def write_c_header(output_file, content, header_fields):
+    """
+    Write the header file for content, streaming the array initializer chunk by chunk.
+
+    content may be a bytes object or an mmap.
+    """
+    # Check for null bytes (not allowed in C strings) before anything is written
+    if content.find(b'\x00') != -1:
+        raise ValueError("File contains null bytes, cannot be converted to C string")
+
+    with open(output_file, 'wb') as f, memoryview(content) as view:
+        f.write(_HEADER_PROLOGUE_TEMPLATE.format_map(header_fields).encode('utf-8'))
+        for chunk in iter_c_char_array_chunks(view):
+            f.write(chunk.encode('ascii'))
+        f.write(_HEADER_EPILOGUE_TEMPLATE.format_map(header_fields).encode('utf-8'))
+
 def convert_file_to_c_string(input_file, output_file, file_type):
     """
-    Convert a file to a C string literal header file.
+    Convert a file to a C header file with the content as a null-terminated char array.
 
     Args:
         input_file: Path to input file (HTML, JS, or CSS)
@@ -77,49 +167,35 @@ def convert_file_to_c_string(input_file, output_file, file_type):
         file_type: Type of file ("html", "js", or "css")
     """
     try:
-        # Read input file as binary, then decode as UTF-8
-        with open(input_file, 'rb') as f:
-            content_bytes = f.read()
-
-        # Decode as UTF-8, replacing invalid sequences
-        try:
-            content = content_bytes.decode('utf-8')
-        except UnicodeDecodeError:
-            # Try to decode with error handling
-            content = content_bytes.decode('utf-8', errors='replace')
-
-        # Escape content for C string
-        escaped_content = escape_c_string(content)
+        # Skip regeneration if the header is newer than both the input and this script,
+        # so unchanged assets do not trigger recompiles of dependent sources
+        if is_output_up_to_date(input_file, output_file):
+            print(f"Up to date: {output_file}")
+            return 0
 
         # Generate header guard and variable names
         header_guard = generate_header_guard_name(input_file, file_type)
         var_name = generate_variable_name(input_file, file_type)
         size_var_name = f"{var_name}_size"
 
-        # Generate header file content with inline array definition
-        header_content = f"""/* Generated header file from {os.path.basename(input_file)}
- *
- * This file was automatically generated. Do not edit manually.
- * Source: {input_file}
- *
- * Copyright (c) 2025 the_louie
- */
+        # Fill in the header file prologue and epilogue around the inline array definition
+        header_fields = {
+            'basename': os.path.basename(input_file),
+            'source': input_file,
+            'header_guard': header_guard,
+            'file_type_upper': file_type.upper(),
+            'var_name': var_name,
+            'size_var_name': size_var_name,
+        }
 
-#ifndef {header_guard}
-#define {header_guard}
-
-#include <stddef.h>
-
-/* Embedded {file_type.upper()} content as C string literal */
-static const char {var_name}[] = "{escaped_content}";
-static const size_t {size_var_name} = sizeof({var_name}) - 1;  /* Exclude null terminator */
-
-#endif /* {header_guard} */
-"""
-
-        # Write header file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(header_content)
+        # Read input file as binary and embed it as UTF-8 bytes, so nothing needs escaping.
+        # Large files are memory-mapped and streamed so they are never held in memory whole.
+        with open(input_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    write_c_header(output_file, mapped, header_fields)
+            else:
+                write_c_header(output_file, f.read(), header_fields)
 
         print(f"Generated: {output_file}")
         return 0
@@ -137,10 +213,77 @@ static const size_t {size_var_name} = sizeof({var_name}) - 1;  /* Exclude null t
         print(f"Error: Unexpected error: {e}", file=sys.stderr)
         return 1
 
+def create_output_dir(output_file):
+    """Create the output file's directory if it doesn't exist."""
+    output_dir = os.path.dirname(output_file)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+def read_manifest(manifest_file):
+    """
+    Read conversion entries from a manifest file.
+
+    Each non-empty line that does not start with '#' holds
+    <input_file>, <output_file> and <file_type> separated by tabs.
+
+    Returns a list of (input_file, output_file, file_type) tuples.
+    """
+    entries = []
+    with open(manifest_file, 'r', encoding='utf-8') as f:
+        for line_num, line in enumerate(f, 1):
+            line = line.rstrip('\r\n')
+            if not line.strip() or line.lstrip().startswith('#'):
+                continue
+
+            fields = line.split('\t')
+            if len(fields) != 3:
+                raise ValueError(f"{manifest_file}:{line_num}: expected <input_file><TAB><output_file><TAB><file_type>")
+
+            input_file, output_file, file_type = fields
+            file_type = file_type.lower()
+            if file_type not in ['html', 'js', 'css']:
+                raise ValueError(f"{manifest_file}:{line_num}: invalid file_type '{file_type}'. Must be 'html', 'js', or 'css'")
+
+            entries.append((input_file, output_file, file_type))
+    return entries
+
+def _convert_entry(entry):
+    """Convert a single (input_file, output_file, file_type) manifest entry."""
+    return convert_file_to_c_string(*entry)
+
+def convert_manifest(entries):
+    """
+    Convert all manifest entries, in parallel worker processes when there is more than one.
+
+    Returns 1 if any conversion failed.
+    """
+    for _, output_file, _ in entries:
+        create_output_dir(output_file)
+
+    # Each output file is independent, so entries can be converted concurrently
+    if len(entries) > 1:
+        with ProcessPoolExecutor(max_workers=min(len(entries), os.cpu_count() or 1)) as pool:
+            results = list(pool.map(_convert_entry, entries))
+    else:
+        results = [_convert_entry(entry) for entry in entries]
+
+    return 1 if any(results) else 0
+
 def main():
+    # Batch mode: convert every asset listed in a manifest in a single process
+    if len(sys.argv) == 3 and sys.argv[1] == '--manifest':
+        try:
+            entries = read_manifest(sys.argv[2])
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        sys.exit(convert_manifest(entries))
+
     if len(sys.argv) != 4:
         print("Usage: convert_file_to_c_string.py <input_file> <output_file> <file_type>", file=sys.stderr)
+        print("       convert_file_to_c_string.py --manifest <manifest_file>", file=sys.stderr)
         print("  file_type: html, js, or css", file=sys.stderr)
+        print("  manifest_file: one <input_file><TAB><output_file><TAB><file_type> entry per line", file=sys.stderr)
         sys.exit(1)
 
     input_file = sys.argv[1]
@@ -151,10 +294,7 @@ def main():
         print(f"Error: Invalid file_type '{file_type}'. Must be 'html', 'js', or 'css'", file=sys.stderr)
         sys.exit(1)
 
-    # Create output directory if it doesn't exist
-    output_dir = os.path.dirname(output_file)
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir, exist_ok=True)
+    create_output_dir(output_file)
 
     sys.exit(convert_file_to_c_string(input_file, output_file, file_type))
 
@@ -10,41 +10,51 @@ a template file with plugin placeholders.
 import re
 import sys
 
+# C string escape sequences and the characters they stand for
+_UNESCAPE_RE = re.compile(r'\\([\\"nrt])')
+_UNESCAPE_MAP = {'\\': '\\', '"': '"', 'n': '\n', 'r': '\r', 't': '\t'}
+
+# Content between a pair of double quotes (matched on raw bytes)
+_QUOTE_RE = re.compile(rb'"([^"]*)"')
+
+# Closing tags that get a plugin placeholder inserted before their first occurrence
+_CLOSING_TAG_RE = re.compile(r'</(style|body|script)>')
+_PLACEHOLDER_INSERTS = {
+    'style': '{{PLUGIN_CSS}}\n</style>',   # Plugin CSS inside the main <style>
+    'body': '{{PLUGIN_HTML}}\n</body>',    # Plugin HTML sections after the main content
+    'script': '{{PLUGIN_JS}}\n</script>',  # Plugin JS inside the main <script>
+}
+
 def unescape_c_string(content):
     """Un-escape C string literal content."""
-    # Replace escaped sequences in reverse order of escape_c_string
-    content = content.replace('\\\\', '\\')  # Must be first
-    content = content.replace('\\"', '"')
-    content = content.replace('\\n', '\n')
-    content = content.replace('\\r', '\r')
-    content = content.replace('\\t', '\t')
-    return content
+    # Single pass, so an escaped backslash is never re-read as the start of another escape
+    return _UNESCAPE_RE.sub(lambda m: _UNESCAPE_MAP[m.group(1)], content)
 
 def extract_html_from_c_file(c_file_path):
     """Extract HTML content from mesh_web.c html_page[] string literal."""
-    with open(c_file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
     # Find start of html_page[] (line 40, 0-indexed is 39)
     # Find end of html_page[] (line 1590, 0-indexed is 1589)
     start_idx = 39  # Line 40 in 1-indexed
     end_idx = 1589  # Line 1590 in 1-indexed
 
-    html_parts = []
+    html_bytes = bytearray()
 
     # Extract lines 40-1590 (1-indexed, so 39-1589 in 0-indexed)
-    for i in range(start_idx, min(end_idx + 1, len(lines))):
-        line = lines[i]
-
-        # Extract content between quotes
-        # Handle lines like: "content"
-        # or: "content"; (last line)
-        matches = re.findall(r'"([^"]*)"', line)
-        for match in matches:
-            html_parts.append(match)
-
-    # Join all parts
-    html_content = ''.join(html_parts)
+    with open(c_file_path, 'rb') as f:
+        for i, line in enumerate(f):
+            if i < start_idx:
+                continue
+            if i > end_idx:
+                break
+
+            # Extract content between quotes
+            # Handle lines like: "content"
+            # or: "content"; (last line)
+            for match in _QUOTE_RE.findall(line):
+                html_bytes.extend(match)
+
+    # Decode all parts at once
+    html_content = html_bytes.decode('utf-8')
 
     # Un-escape C string
     html_content = unescape_c_string(html_content)
@@ -53,32 +63,18 @@ def extract_html_from_c_file(c_file_path):
 
 def add_plugin_placeholders(html_content):
     """Add plugin placeholders to HTML template."""
-    # Find </style> and add {{PLUGIN_CSS}} before it
-    html_content = re.sub(
-        r'(</style>)',
-        r'{{PLUGIN_CSS}}\n\1',
-        html_content,
-        count=1
-    )
-
-    # Find </body> and add {{PLUGIN_HTML}} before it (but after </div> closing container)
-    # Insert before </body> but after the closing </div> of container
-    html_content = re.sub(
-        r'(</body>)',
-        r'{{PLUGIN_HTML}}\n\1',
-        html_content,
-        count=1
-    )
-
-    # Find </script> and add {{PLUGIN_JS}} before it
-    html_content = re.sub(
-        r'(</script>)',
-        r'{{PLUGIN_JS}}\n\1',
-        html_content,
-        count=1
-    )
-
-    return html_content
+    # Placeholders go before the first </style>, </body> and </script> respectively,
+    # all inserted during a single scan of the template
+    seen_tags = set()
+
+    def insert_placeholder(match):
+        tag = match.group(1)
+        if tag in seen_tags:
+            return match.group(0)
+        seen_tags.add(tag)
+        return _PLACEHOLDER_INSERTS[tag]
+
+    return _CLOSING_TAG_RE.sub(insert_placeholder, html_content)
 
 if __name__ == '__main__':
     if len(sys.argv) < 3:
@@ -9,45 +9,50 @@ and converts it to a proper HTML template file with plugin placeholders.
 import re
 import sys
 
+# C string escape sequences and the characters they stand for
+_UNESCAPE_RE = re.compile(r'\\([\\"nrt])')
+_UNESCAPE_MAP = {'\\': '\\', '"': '"', 'n': '\n', 'r': '\r', 't': '\t'}
+
+# Content between a pair of double quotes, allowing escaped characters inside
+_QUOTED_STRING_RE = re.compile(r'"([^"]*(?:\\.[^"]*)*)"')
+
 def unescape_c_string(content):
     """Un-escape C string literal content."""
-    # Replace escaped sequences in reverse order of escape_c_string
-    content = content.replace('\\\\', '\\')  # Must be first
-    content = content.replace('\\"', '"')
-    content = content.replace('\\n', '\n')
-    content = content.replace('\\r', '\r')
-    content = content.replace('\\t', '\t')
-    return content
+    # Single pass, so an escaped backslash is never re-read as the start of another escape
+    return _UNESCAPE_RE.sub(lambda m: _UNESCAPE_MAP[m.group(1)], content)
 
 def extract_html_from_c_file(c_file_path):
     """Extract HTML content from mesh_web.c html_page[] string literal."""
-    with open(c_file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
     # Find start of html_page[] (line 39, 0-indexed is 38)
     start_line_idx = 38  # 0-indexed
-    # Find end (look for </html>"; pattern, around line 1593)
+    # Find end (look for </html>"; pattern, around line 1593) in a single pass,
+    # remembering the first plain </html> line as a fallback end
     end_line_idx = None
-    for i in range(start_line_idx, len(lines)):
-        line = lines[i]
-        # Check if line contains </html> and ends with ";
-        if '</html>' in line and line.strip().endswith('";'):
-            end_line_idx = i + 1  # Include this line
-            break
+    fallback_end_line_idx = None
+    html_lines = []
+    with open(c_file_path, 'r', encoding='utf-8') as f:
+        for i, line in enumerate(f):
+            if i < start_line_idx:
+                continue
+            html_lines.append(line)
+            if '</html>' in line:
+                # Check if line ends with "; (preferred end)
+                if line.strip().endswith('";'):
+                    end_line_idx = i + 1  # Include this line
+                    break
+                if fallback_end_line_idx is None and i < start_line_idx + 2000:
+                    fallback_end_line_idx = i + 1
 
     if end_line_idx is None:
-        # Fallback: search for pattern
-        for i in range(start_line_idx, min(start_line_idx + 2000, len(lines))):
-            if '</html>' in lines[i]:
-                end_line_idx = i + 1
-                break
+        # Fallback: first line containing </html>
+        end_line_idx = fallback_end_line_idx
 
     if end_line_idx is None:
         print(f"Error: Could not find end of html_page[]", file=sys.stderr)
         return None
 
     # Extract HTML content lines (lines 40-1593, 1-indexed)
-    html_lines = lines[start_line_idx:end_line_idx]
+    html_lines = html_lines[:end_line_idx - start_line_idx]
 
     # Process each line to extract content between quotes
     html_content = []
@@ -77,13 +82,13 @@ def extract_html_from_c_file(c_file_path):
                 html_content.append(content)
             else:
                 # Try regex to extract quoted content
-                matches = re.findall(r'"([^"]*(?:\\.[^"]*)*)"', stripped)
+                matches = _QUOTED_STRING_RE.findall(stripped)
                 for match in matches:
                     content = unescape_c_string(match)
                     html_content.append(content)
         else:
             # Try to extract any quoted content from the line
-            matches = re.findall(r'"([^"]*(?:\\.[^"]*)*)"', stripped)
+            matches = _QUOTED_STRING_RE.findall(stripped)
             for match in matches:
                 content = unescape_c_string(match)
                 html_content.append(content)
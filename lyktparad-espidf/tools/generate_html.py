@@ -17,109 +17,258 @@ CONDITIONS OF ANY KIND, either express or implied.
 import sys
 import os
 import argparse
+import json
 import re
+import string
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from html import escape
+from operator import attrgetter
 from pathlib import Path
 
 
-def escape_c_string(content):
-    """Escape content for C string literal."""
-    # Escape backslashes first (before other escape sequences)
-    content = content.replace('\\', '\\\\')
-    # Escape double quotes
-    content = content.replace('"', '\\"')
-    # Escape newlines
-    content = content.replace('\n', '\\n')
-    # Escape carriage returns
-    content = content.replace('\r', '\\r')
-    # Escape tabs
-    content = content.replace('\t', '\\t')
+# C string literal escape sequences for UTF-8 encoded content, applied in a single regex pass
+_C_ESCAPE_MAP = {
+    b'\\': b'\\\\',
+    b'"': b'\\"',
+    b'\n': b'\\n',
+    b'\r': b'\\r',
+    b'\t': b'\\t',
+}
+_C_ESCAPE_RE = re.compile(rb'[\\"\n\r\t]')
+
+# Bytes that need escaping (or rejecting) in a C string literal
+_NEEDS_ESCAPE_RE = re.compile(rb'[\x00\t\n\r"\\]')
+
+
+def escape_c_bytes(content):
+    """Escape UTF-8 encoded content for C string literal."""
+    # Fast path: nothing to escape, return the content unchanged without copying it.
+    # UTF-8 multi-byte sequences never contain ASCII bytes, so they pass through untouched
+    if _NEEDS_ESCAPE_RE.search(content) is None:
+        return content
     # Check for null bytes (not allowed in C strings)
-    if '\x00' in content:
+    if b'\x00' in content:
+        raise ValueError("Content contains null bytes, cannot be converted to C string")
+    # Escape backslashes, double quotes, newlines, carriage returns and tabs
+    return _C_ESCAPE_RE.sub(lambda m: _C_ESCAPE_MAP[m.group(0)], content)
+
+
+def escape_c_bytes_iter(content, chunk_size=8192):
+    """
+    Escape UTF-8 encoded content for C string literal in chunks.
+
+    Returns an iterator of escaped byte chunks, so large content can be written out
+    without holding a full escaped copy in memory. Every escape sequence comes from a
+    single ASCII byte, so chunk boundaries never split one. Null bytes are rejected up
+    front, before any chunk is produced.
+    """
+    if b'\x00' in content:
         raise ValueError("Content contains null bytes, cannot be converted to C string")
-    return content
+    return (escape_c_bytes(content[offset:offset + chunk_size])
+            for offset in range(0, len(content), chunk_size))
+
+
+# Plugin names are escaped for attributes by the dropdown, the basic UI and the section
+# wrappers of both generators, so the result is memoized per name
+@lru_cache(maxsize=None)
+def escape_html_attr(value):
+    """Escape a string for use in a double-quoted HTML attribute value."""
+    return escape(value, quote=True)
+
 
+# Display names are escaped as text by both the dropdown and the basic UI
+@lru_cache(maxsize=None)
+def escape_html_text(value):
+    """Escape a string for use as HTML text content."""
+    return escape(value, quote=False)
 
-def collect_plugin_files(plugins_dir):
+
+# Version of the on-disk plugin cache format written by collect_plugin_files
+_PLUGIN_CACHE_VERSION = 2
+
+# Plugin record returned by collect_plugin_files
+Plugin = namedtuple('Plugin', 'name html_file css_file js_file')
+
+
+def _list_dir_names(dir_path, dir_mtimes=None):
+    """
+    Return the set of entry names in a directory, or an empty set if it can't be listed.
+
+    If dir_mtimes is a dict, the directory's mtime is recorded in it (keyed by path)
+    before listing, so later changes to the listing can be detected.
+    """
+    try:
+        if dir_mtimes is not None:
+            dir_mtimes[dir_path] = os.stat(dir_path).st_mtime_ns
+        with os.scandir(dir_path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+
+def _load_plugin_cache(cache_file, plugins_dir):
+    """
+    Load cached plugin records, or return None if the cache is missing or stale.
+
+    The cache is valid only if every directory listed during the original scan
+    still has the same mtime, since adding, removing or renaming an entry in a
+    directory updates that directory's mtime.
+    """
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') != _PLUGIN_CACHE_VERSION or cache.get('plugins_dir') != plugins_dir:
+            return None
+        for dir_path, mtime_ns in cache['dir_mtimes'].items():
+            if os.stat(dir_path).st_mtime_ns != mtime_ns:
+                return None
+        return [Plugin(*record) for record in cache['plugins']]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _save_plugin_cache(cache_file, plugins_dir, dir_mtimes, plugins):
+    """Write plugin records and the directory mtimes they were derived from to the cache file."""
+    cache = {
+        'version': _PLUGIN_CACHE_VERSION,
+        'plugins_dir': plugins_dir,
+        'dir_mtimes': dir_mtimes,
+        'plugins': plugins,
+    }
+    try:
+        cache_dir = os.path.dirname(cache_file)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"Warning: Failed to write plugin cache {cache_file}: {e}", file=sys.stderr)
+
+
+def collect_plugin_files(plugins_dir, cache_file=None):
     """
     Collect plugin HTML, CSS, and JS files from plugin directories.
 
-    Returns a list of dictionaries, each containing:
+    If cache_file is given, results are cached there keyed on the mtimes of the
+    scanned directories, and an unchanged plugin tree is not rescanned.
+
+    Returns a list of Plugin records, each containing:
     - name: plugin name
     - html_file: path to HTML file (or None)
     - css_file: path to CSS file (or None)
     - js_file: path to JS file (or None)
     """
+    if cache_file:
+        cached_plugins = _load_plugin_cache(cache_file, plugins_dir)
+        if cached_plugins is not None:
+            return cached_plugins
+
     plugins = []
+    # Directory mtimes are only needed when results are cached
+    dir_mtimes = {} if cache_file else None
 
-    if not os.path.exists(plugins_dir):
+    try:
+        if dir_mtimes is not None:
+            dir_mtimes[plugins_dir] = os.stat(plugins_dir).st_mtime_ns
+        with os.scandir(plugins_dir) as entries:
+            plugin_entries = list(entries)
+    except FileNotFoundError:
         return plugins
 
-    # Scan plugin directories
-    for item in os.listdir(plugins_dir):
-        plugin_path = os.path.join(plugins_dir, item)
-        if not os.path.isdir(plugin_path):
+    # Scan plugin directories (directory entries avoid a stat() per existence check)
+    for entry in plugin_entries:
+        if not entry.is_dir():
             continue
 
-        plugin_name = item
+        plugin_name = entry.name
+        plugin_path = entry.path
+        names = _list_dir_names(plugin_path, dir_mtimes)
 
         # Check for required plugin files
-        plugin_c_file = os.path.join(plugin_path, f"{plugin_name}_plugin.c")
-        plugin_h_file = os.path.join(plugin_path, f"{plugin_name}_plugin.h")
-
-        if not os.path.exists(plugin_c_file) or not os.path.exists(plugin_h_file):
+        if f"{plugin_name}_plugin.c" not in names or f"{plugin_name}_plugin.h" not in names:
             continue
 
         # Find HTML file (either <plugin-name>.html or index.html)
-        html_file = os.path.join(plugin_path, f"{plugin_name}.html")
-        if not os.path.exists(html_file):
+        if f"{plugin_name}.html" in names:
+            html_file = os.path.join(plugin_path, f"{plugin_name}.html")
+        elif "index.html" in names:
             html_file = os.path.join(plugin_path, "index.html")
-            if not os.path.exists(html_file):
-                html_file = None
+        else:
+            html_file = None
 
         # Find CSS file
-        css_file = os.path.join(plugin_path, "css", f"{plugin_name}.css")
-        if not os.path.exists(css_file):
-            css_file = None
+        css_file = None
+        if "css" in names and f"{plugin_name}.css" in _list_dir_names(os.path.join(plugin_path, "css"), dir_mtimes):
+            css_file = os.path.join(plugin_path, "css", f"{plugin_name}.css")
 
         # Find JS file
-        js_file = os.path.join(plugin_path, "js", f"{plugin_name}.js")
-        if not os.path.exists(js_file):
-            js_file = None
+        js_file = None
+        if "js" in names and f"{plugin_name}.js" in _list_dir_names(os.path.join(plugin_path, "js"), dir_mtimes):
+            js_file = os.path.join(plugin_path, "js", f"{plugin_name}.js")
 
-        plugins.append({
-            'name': plugin_name,
-            'html_file': html_file,
-            'css_file': css_file,
-            'js_file': js_file,
-        })
+        plugins.append(Plugin(plugin_name, html_file, css_file, js_file))
 
     # Sort plugins alphabetically by name
-    plugins.sort(key=lambda x: x['name'])
+    plugins.sort(key=attrgetter('name'))
+
+    if cache_file:
+        _save_plugin_cache(cache_file, plugins_dir, dir_mtimes, plugins)
 
     return plugins
 
 
 def read_file_safe(file_path):
     """Read a file, returning None if file doesn't exist."""
-    if file_path is None or not os.path.exists(file_path):
+    if file_path is None:
         return None
 
     try:
-        with open(file_path, 'rb') as f:
-            content_bytes = f.read()
-
-        # Decode as UTF-8, replacing invalid sequences
+        # Read the file with raw reads sized by its stat-reported size, without the buffered
+        # file object machinery (O_BINARY avoids newline translation on Windows). Reading
+        # continues until EOF, so a short read or a file that grew since the stat is not
+        # truncated; for a regular file that has not changed this is one read plus the EOF read
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
         try:
-            content = content_bytes.decode('utf-8')
-        except UnicodeDecodeError:
-            content = content_bytes.decode('utf-8', errors='replace')
+            chunks = []
+            chunk = os.read(fd, max(os.fstat(fd).st_size, 1 << 16))
+            while chunk:
+                chunks.append(chunk)
+                chunk = os.read(fd, 1 << 16)
+        finally:
+            os.close(fd)
+        content_bytes = b''.join(chunks)
 
-        return content
+        # Decode as UTF-8, replacing invalid sequences
+        return content_bytes.decode('utf-8', errors='replace')
+    except FileNotFoundError:
+        return None
     except Exception as e:
         print(f"Warning: Failed to read {file_path}: {e}", file=sys.stderr)
         return None
 
 
+def read_plugin_files(plugins, kinds=('html', 'css', 'js')):
+    """
+    Read plugin files of the given kinds concurrently.
+
+    Returns a dictionary mapping (plugin name, kind) to file content (None if the file
+    couldn't be read). Plugins without a file of a given kind have no entry for it.
+    """
+    tasks = [(plugin.name, kind, getattr(plugin, f'{kind}_file'))
+             for plugin in plugins for kind in kinds if getattr(plugin, f'{kind}_file')]
+    if not tasks:
+        return {}
+
+    # File reads release the GIL, so a thread pool hides per-file I/O latency
+    with ThreadPoolExecutor(max_workers=min(len(tasks), (os.cpu_count() or 1) * 2)) as executor:
+        contents = executor.map(read_file_safe, [file_path for _, _, file_path in tasks])
+        return {(name, kind): content for (name, kind, _), content in zip(tasks, contents)}
+
+
+# Called for the dropdown and again for each basic UI, so results are memoized per name
+@lru_cache(maxsize=None)
 def format_plugin_display_name(plugin_name):
     """
     Convert plugin directory name to display name.
@@ -132,14 +281,10 @@ def format_plugin_display_name(plugin_name):
     if not plugin_name:
         return ""
 
-    # Replace underscores with spaces
-    display_name = plugin_name.replace('_', ' ')
-
-    # Capitalize first letter of each word
-    words = display_name.split()
-    display_name = ' '.join(word.capitalize() for word in words)
-
-    return display_name
+    # Replace underscores with spaces and capitalize first letter of each word.
+    # str.title() is not used because it also capitalizes after digits and hyphens
+    # (e.g. "2d_fade" would become "2D Fade").
+    return string.capwords(plugin_name.replace('_', ' '))
 
 
 def generate_dropdown_html(plugins):
@@ -151,41 +296,24 @@ def generate_dropdown_html(plugins):
     if not plugins:
         return ""
 
-    options = []
     # No default "Select Plugin..." option - first plugin will be selected by default
-
-    for plugin in plugins:
-        display_name = format_plugin_display_name(plugin['name'])
-        # Escape HTML special characters in plugin name
-        plugin_name_escaped = plugin['name'].replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')
-        display_name_escaped = display_name.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-        # Mark first plugin as selected by default
-        selected_attr = ' selected' if len(options) == 0 else ''
-        options.append(f'<option value="{plugin_name_escaped}"{selected_attr}>{display_name_escaped}</option>')
+    # Escape HTML special characters in plugin name and display name
+    options = [
+        f'<option value="{escape_html_attr(plugin.name)}"{" selected" if index == 0 else ""}>'
+        f'{escape_html_text(format_plugin_display_name(plugin.name))}</option>'
+        for index, plugin in enumerate(plugins)
+    ]
 
     # Return just the select element - container div is in template
-    dropdown_html = f'''<select id="plugin-selector" class="plugin-selector" aria-label="Select plugin">
-{chr(10).join(options)}
-</select>'''
-
-    return dropdown_html
+    return '\n'.join([
+        '<select id="plugin-selector" class="plugin-selector" aria-label="Select plugin">',
+        *options,
+        '</select>',
+    ])
 
 
-def generate_layout_css():
-    """
-    Generate CSS for page layout with fixed header and plugin selection.
-
-    Returns CSS string for:
-    - .page-header (fixed, 150px height)
-    - .page-title (title styling)
-    - .plugin-dropdown-container (dropdown positioning)
-    - .plugin-selector (dropdown styling)
-    - .page-content (content area with margin-top)
-    - .plugin-section (hidden by default)
-    - .plugin-section.active (visible)
-    - Responsive design
-    """
-    css = '''
+# Static layout CSS, materialized once at import
+_LAYOUT_CSS = '''
 /* Plugin Selection Dropdown Layout Styles */
 .page-header {
     position: fixed;
@@ -313,46 +441,66 @@ def generate_layout_css():
     }
 }
 '''
-    return css
 
 
-def generate_basic_plugin_ui(plugin_name):
+def generate_layout_css():
     """
-    Generate basic control UI HTML for a plugin without custom HTML.
+    Generate CSS for page layout with fixed header and plugin selection.
 
-    Returns HTML string with plugin name header, control buttons (START, STOP, PAUSE, RESET),
-    status indicator, and error message area.
+    Returns CSS string for:
+    - .page-header (fixed, 150px height)
+    - .page-title (title styling)
+    - .plugin-dropdown-container (dropdown positioning)
+    - .plugin-selector (dropdown styling)
+    - .page-content (content area with margin-top)
+    - .plugin-section (hidden by default)
+    - .plugin-section.active (visible)
+    - Responsive design
     """
-    display_name = format_plugin_display_name(plugin_name)
-    # Escape HTML special characters for attribute value and text content
-    plugin_name_escaped_attr = plugin_name.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')
-    display_name_escaped = display_name.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    return _LAYOUT_CSS
+
 
-    html = f'''<div class="basic-plugin-ui">
-    <h2 class="basic-plugin-ui-title">{display_name_escaped}</h2>
+# Basic plugin UI HTML, with {name_attr} (attribute-escaped plugin name) and
+# {display} (text-escaped display name) placeholders
+_BASIC_UI_TEMPLATE = '''<div class="basic-plugin-ui">
+    <h2 class="basic-plugin-ui-title">{display}</h2>
     <div class="basic-plugin-ui-status">
         <span class="basic-plugin-ui-status-label">Status:</span>
-        <span class="basic-plugin-ui-status-value" id="basic-plugin-status-{plugin_name_escaped_attr}">Inactive</span>
+        <span class="basic-plugin-ui-status-value" id="basic-plugin-status-{name_attr}">Inactive</span>
     </div>
     <div class="basic-plugin-ui-controls">
-        <button class="basic-plugin-btn basic-plugin-btn-start" id="basic-plugin-start-{plugin_name_escaped_attr}" data-plugin-name="{plugin_name_escaped_attr}">START</button>
-        <button class="basic-plugin-btn basic-plugin-btn-pause" id="basic-plugin-pause-{plugin_name_escaped_attr}" data-plugin-name="{plugin_name_escaped_attr}">PAUSE</button>
-        <button class="basic-plugin-btn basic-plugin-btn-reset" id="basic-plugin-reset-{plugin_name_escaped_attr}" data-plugin-name="{plugin_name_escaped_attr}">RESET</button>
-        <button class="basic-plugin-btn basic-plugin-btn-stop" id="basic-plugin-stop-{plugin_name_escaped_attr}" data-plugin-name="{plugin_name_escaped_attr}">STOP</button>
+        <button class="basic-plugin-btn basic-plugin-btn-start" id="basic-plugin-start-{name_attr}" data-plugin-name="{name_attr}" data-action="start">START</button>
+        <button class="basic-plugin-btn basic-plugin-btn-pause" id="basic-plugin-pause-{name_attr}" data-plugin-name="{name_attr}" data-action="pause">PAUSE</button>
+        <button class="basic-plugin-btn basic-plugin-btn-reset" id="basic-plugin-reset-{name_attr}" data-plugin-name="{name_attr}" data-action="reset">RESET</button>
+        <button class="basic-plugin-btn basic-plugin-btn-stop" id="basic-plugin-stop-{name_attr}" data-plugin-name="{name_attr}" data-action="stop">STOP</button>
     </div>
-    <div class="basic-plugin-ui-feedback" id="basic-plugin-feedback-{plugin_name_escaped_attr}"></div>
+    <div class="basic-plugin-ui-feedback" id="basic-plugin-feedback-{name_attr}"></div>
 </div>'''
-    return html
 
+# _BASIC_UI_TEMPLATE pre-split into (literal text, field name) pairs, so the template
+# is parsed once at import instead of on every call
+_BASIC_UI_PARTS = tuple((literal, field) for literal, field, _, _ in string.Formatter().parse(_BASIC_UI_TEMPLATE))
 
-def generate_basic_plugin_ui_css():
+
+def generate_basic_plugin_ui(plugin_name):
     """
-    Generate CSS for basic plugin control UI.
+    Generate basic control UI HTML for a plugin without custom HTML.
 
-    Returns CSS string for plugin name header, control buttons, status indicator,
-    and error message area. Styled consistently with existing UI.
+    Returns HTML string with plugin name header, control buttons (START, STOP, PAUSE, RESET),
+    status indicator, and error message area.
     """
-    css = '''
+    # Escape HTML special characters for attribute value and text content
+    fields = {
+        'name_attr': escape_html_attr(plugin_name),
+        'display': escape_html_text(format_plugin_display_name(plugin_name)),
+    }
+
+    # Splice the escaped values between the precomputed literal fragments
+    return ''.join(literal + fields[field] if field else literal for literal, field in _BASIC_UI_PARTS)
+
+
+# Static basic plugin UI CSS, materialized once at import
+_BASIC_UI_CSS = '''
 /* Basic Plugin UI Styles */
 .basic-plugin-ui {
     padding: 20px;
@@ -502,20 +650,50 @@ def generate_basic_plugin_ui_css():
     }
 }
 '''
-    return css
 
 
-def generate_basic_plugin_ui_js():
+def generate_basic_plugin_ui_css():
     """
-    Generate JavaScript for basic plugin control UI.
+    Generate CSS for basic plugin control UI.
 
-    Returns JavaScript string with button click handlers for START, STOP, PAUSE, RESET,
-    API call functions, error handling, loading states, and UI state updates.
+    Returns CSS string for plugin name header, control buttons, status indicator,
+    and error message area. Styled consistently with existing UI.
     """
-    js = '''
+    return _BASIC_UI_CSS
+
+
+# Static basic plugin UI JavaScript, materialized once at import
+_BASIC_UI_JS = '''
 (function() {
     'use strict';
 
+    // Control button actions (data-action): API endpoint, feedback messages and,
+    // where known, the plugin status after the request succeeds
+    var ACTIONS = {
+        start: {
+            endpoint: '/api/plugin/activate',
+            pending: 'Activating plugin...',
+            done: 'Plugin activated successfully',
+            active: true
+        },
+        stop: {
+            endpoint: '/api/plugin/stop',
+            pending: 'Stopping plugin...',
+            done: 'Plugin stopped successfully',
+            active: false
+        },
+        pause: {
+            endpoint: '/api/plugin/pause',
+            pending: 'Pausing plugin...',
+            done: 'Plugin paused successfully'
+        },
+        reset: {
+            endpoint: '/api/plugin/reset',
+            pending: 'Resetting plugin...',
+            done: 'Plugin reset successfully'
+        }
+    };
+
     // Basic Plugin UI Controller
     var BasicPluginUI = {
         // Send API request
@@ -569,90 +747,41 @@ def generate_basic_plugin_ui_js():
             }
         },
 
-        // Handle START button click
-        handleStart: function(pluginName) {
-            var startBtn = document.getElementById('basic-plugin-start-' + pluginName);
-            this.setButtonLoading(startBtn, true);
-            this.updateFeedback(pluginName, 'Activating plugin...', 'info');
-
-            this.apiRequest('/api/plugin/activate', 'POST', { name: pluginName })
-                .then(function(response) {
-                    BasicPluginUI.updateFeedback(pluginName, 'Plugin activated successfully', 'success');
-                    BasicPluginUI.updateStatus(pluginName, true);
-                    // Poll for active plugin status
-                    setTimeout(function() {
-                        BasicPluginUI.checkActivePlugin(pluginName);
-                    }, 500);
-                })
-                .catch(function(error) {
-                    BasicPluginUI.updateFeedback(pluginName, 'Error: ' + error.message, 'error');
-                })
-                .finally(function() {
-                    BasicPluginUI.setButtonLoading(startBtn, false);
-                });
-        },
-
-        // Handle STOP button click
-        handleStop: function(pluginName) {
-            var stopBtn = document.getElementById('basic-plugin-stop-' + pluginName);
-            this.setButtonLoading(stopBtn, true);
-            this.updateFeedback(pluginName, 'Stopping plugin...', 'info');
-
-            this.apiRequest('/api/plugin/stop', 'POST', { name: pluginName })
-                .then(function(response) {
-                    BasicPluginUI.updateFeedback(pluginName, 'Plugin stopped successfully', 'success');
-                    BasicPluginUI.updateStatus(pluginName, false);
-                })
-                .catch(function(error) {
-                    BasicPluginUI.updateFeedback(pluginName, 'Error: ' + error.message, 'error');
-                })
-                .finally(function() {
-                    BasicPluginUI.setButtonLoading(stopBtn, false);
-                });
-        },
-
-        // Handle PAUSE button click
-        handlePause: function(pluginName) {
-            var pauseBtn = document.getElementById('basic-plugin-pause-' + pluginName);
-            this.setButtonLoading(pauseBtn, true);
-            this.updateFeedback(pluginName, 'Pausing plugin...', 'info');
-
-            this.apiRequest('/api/plugin/pause', 'POST', { name: pluginName })
-                .then(function(response) {
-                    BasicPluginUI.updateFeedback(pluginName, 'Plugin paused successfully', 'success');
-                })
-                .catch(function(error) {
-                    BasicPluginUI.updateFeedback(pluginName, 'Error: ' + error.message, 'error');
-                })
-                .finally(function() {
-                    BasicPluginUI.setButtonLoading(pauseBtn, false);
-                });
-        },
-
-        // Handle RESET button click
-        handleReset: function(pluginName) {
-            var resetBtn = document.getElementById('basic-plugin-reset-' + pluginName);
-            this.setButtonLoading(resetBtn, true);
-            this.updateFeedback(pluginName, 'Resetting plugin...', 'info');
+        // Handle a control button click by sending its action's API request
+        handleAction: function(pluginName, action, button) {
+            var spec = ACTIONS[action];
+            if (!spec) {
+                return;
+            }
+            this.setButtonLoading(button, true);
+            this.updateFeedback(pluginName, spec.pending, 'info');
 
-            this.apiRequest('/api/plugin/reset', 'POST', { name: pluginName })
+            this.apiRequest(spec.endpoint, 'POST', { name: pluginName })
                 .then(function(response) {
-                    BasicPluginUI.updateFeedback(pluginName, 'Plugin reset successfully', 'success');
+                    BasicPluginUI.updateFeedback(pluginName, spec.done, 'success');
+                    if (spec.active !== undefined) {
+                        BasicPluginUI.updateStatus(pluginName, spec.active);
+                    }
+                    if (spec.active) {
+                        // Poll for active plugin status
+                        setTimeout(function() {
+                            BasicPluginUI.checkActivePlugin();
+                        }, 500);
+                    }
                 })
                 .catch(function(error) {
                     BasicPluginUI.updateFeedback(pluginName, 'Error: ' + error.message, 'error');
                 })
                 .finally(function() {
-                    BasicPluginUI.setButtonLoading(resetBtn, false);
+                    BasicPluginUI.setButtonLoading(button, false);
                 });
         },
 
-        // Check active plugin status
-        checkActivePlugin: function(pluginName) {
+        // Check active plugin status once and broadcast it to all basic plugin UIs
+        checkActivePlugin: function() {
             this.apiRequest('/api/plugin/active', 'GET')
                 .then(function(response) {
-                    var isActive = response.active === pluginName;
-                    BasicPluginUI.updateStatus(pluginName, isActive);
+                    document.dispatchEvent(new CustomEvent('active-plugin-changed', { detail: response.active }));
                 })
                 .catch(function(error) {
                     // Silently ignore polling errors
@@ -660,48 +789,44 @@ def generate_basic_plugin_ui_js():
         },
 
         // Initialize plugin UI
-        init: function(pluginName) {
+        init: function(pluginName, ui) {
             var self = this;
 
-            // Set up button event listeners
-            var startBtn = document.getElementById('basic-plugin-start-' + pluginName);
-            var stopBtn = document.getElementById('basic-plugin-stop-' + pluginName);
-            var pauseBtn = document.getElementById('basic-plugin-pause-' + pluginName);
-            var resetBtn = document.getElementById('basic-plugin-reset-' + pluginName);
-
-            if (startBtn) {
-                startBtn.addEventListener('click', function() {
-                    self.handleStart(pluginName);
-                });
-            }
-
-            if (stopBtn) {
-                stopBtn.addEventListener('click', function() {
-                    self.handleStop(pluginName);
-                });
-            }
-
-            if (pauseBtn) {
-                pauseBtn.addEventListener('click', function() {
-                    self.handlePause(pluginName);
+            // One delegated listener handles all control buttons
+            var controls = ui.querySelector('.basic-plugin-ui-controls');
+            if (controls) {
+                controls.addEventListener('click', function(e) {
+                    var button = e.target.closest('button[data-action]');
+                    if (button && controls.contains(button)) {
+                        self.handleAction(pluginName, button.getAttribute('data-action'), button);
+                    }
                 });
             }
 
-            if (resetBtn) {
-                resetBtn.addEventListener('click', function() {
-                    self.handleReset(pluginName);
-                });
-            }
+            // Update status whenever the shared poll reports the active plugin
+            document.addEventListener('active-plugin-changed', function(e) {
+                self.updateStatus(pluginName, e.detail === pluginName);
+            });
+        }
+    };
 
-            // Check initial status
-            this.checkActivePlugin(pluginName);
+    // Shared active plugin status poll, paused while the page is hidden
+    var activePluginTimer = null;
 
-            // Poll for status updates every 2 seconds
-            setInterval(function() {
-                self.checkActivePlugin(pluginName);
+    function startActivePluginPolling() {
+        if (activePluginTimer === null) {
+            activePluginTimer = setInterval(function() {
+                BasicPluginUI.checkActivePlugin();
             }, 2000);
         }
-    };
+    }
+
+    function stopActivePluginPolling() {
+        if (activePluginTimer !== null) {
+            clearInterval(activePluginTimer);
+            activePluginTimer = null;
+        }
+    }
 
     // Initialize all basic plugin UIs on DOM ready
     function initBasicPluginUIs() {
@@ -711,10 +836,35 @@ def generate_basic_plugin_ui_js():
             if (section) {
                 var pluginName = section.getAttribute('data-plugin-name');
                 if (pluginName) {
-                    BasicPluginUI.init(pluginName);
+                    BasicPluginUI.init(pluginName, ui);
                 }
             }
         });
+
+        if (basicUIs.length === 0) {
+            return;
+        }
+
+        // Check initial status
+        BasicPluginUI.checkActivePlugin();
+
+        // Poll for status updates every 2 seconds with one request shared by all UIs.
+        // When the plugin selector already polls the active plugin (external webserver),
+        // it broadcasts the same event, so no second poll is started here.
+        if (typeof getActivePlugin !== 'function') {
+            if (document.visibilityState !== 'hidden') {
+                startActivePluginPolling();
+            }
+            document.addEventListener('visibilitychange', function() {
+                if (document.visibilityState === 'hidden') {
+                    stopActivePluginPolling();
+                } else {
+                    // Refresh right away instead of waiting for the next tick
+                    BasicPluginUI.checkActivePlugin();
+                    startActivePluginPolling();
+                }
+            });
+        }
     }
 
     if (document.readyState === 'loading') {
@@ -724,7 +874,16 @@ def generate_basic_plugin_ui_js():
     }
 })();
 '''
-    return js
+
+
+def generate_basic_plugin_ui_js():
+    """
+    Generate JavaScript for basic plugin control UI.
+
+    Returns JavaScript string with button click handlers for START, STOP, PAUSE, RESET,
+    API call functions, error handling, loading states, and UI state updates.
+    """
+    return _BASIC_UI_JS
 
 
 def generate_selection_js(plugins):
@@ -740,14 +899,16 @@ def generate_selection_js(plugins):
     if not plugins:
         return ""
 
-    # Create list of plugin names for JavaScript
-    plugin_names_js = ', '.join('"' + plugin["name"].replace("\\", "\\\\").replace('"', '\\"') + '"' for plugin in plugins)
+    # Create array of plugin names for JavaScript (JSON is a valid JS array literal)
+    plugin_names_json = json.dumps([plugin.name for plugin in plugins])
 
     js = f'''
 (function() {{
     'use strict';
 
-    var plugins = [{plugin_names_js}];
+    var plugins = {plugin_names_json};
+    // Set of the same names for constant-time isValidPlugin checks
+    var pluginSet = new Set(plugins);
 
     var PluginSelector = {{
         init: function() {{
@@ -791,10 +952,12 @@ def generate_selection_js(plugins):
                 }}
             }}
 
-            // Poll active plugin status (external webserver only)
+            // Poll active plugin status (external webserver only) and broadcast it,
+            // so basic plugin UIs share this poll instead of running their own
             if (typeof getActivePlugin === 'function') {{
-                setInterval(function() {{
+                var pollActivePlugin = function() {{
                     getActivePlugin().then(function(activePlugin) {{
+                        document.dispatchEvent(new CustomEvent('active-plugin-changed', {{ detail: activePlugin }}));
                         if (activePlugin && selector.value !== activePlugin) {{
                             selector.value = activePlugin;
                             PluginSelector.selectPlugin(activePlugin);
@@ -807,7 +970,27 @@ def generate_selection_js(plugins):
                     }}).catch(function(error) {{
                         // Silently ignore polling errors
                     }});
-                }}, 2000); // Poll every 2 seconds
+                }};
+
+                // Poll every 2 seconds, paused while the page is hidden
+                var activePluginTimer = null;
+                var startPolling = function() {{
+                    if (activePluginTimer === null) {{
+                        activePluginTimer = setInterval(pollActivePlugin, 2000);
+                    }}
+                }};
+                if (document.visibilityState !== 'hidden') {{
+                    startPolling();
+                }}
+                document.addEventListener('visibilitychange', function() {{
+                    if (document.visibilityState === 'hidden') {{
+                        clearInterval(activePluginTimer);
+                        activePluginTimer = null;
+                    }} else {{
+                        pollActivePlugin();
+                        startPolling();
+                    }}
+                }});
             }}
 
             // Add change event listener
@@ -860,7 +1043,7 @@ def generate_selection_js(plugins):
         }},
 
         isValidPlugin: function(pluginName) {{
-            return plugins.indexOf(pluginName) !== -1;
+            return pluginSet.has(pluginName);
         }},
 
         selectPlugin: function(pluginName) {{
@@ -876,6 +1059,7 @@ def generate_selection_js(plugins):
             if (meshControlSection) {{
                 if (pluginName === 'sequence') {{
                     meshControlSection.style.display = 'block';
+                    document.dispatchEvent(new CustomEvent('plugin:shown', {{ detail: {{ name: 'mesh-control' }} }}));
                 }} else {{
                     meshControlSection.style.display = 'none';
                 }}
@@ -911,6 +1095,130 @@ def generate_selection_js(plugins):
     return js
 
 
+# Patterns used to minify the built-in mesh control CSS and JavaScript before embedding
+# CSS tokens: quoted strings, comments, whitespace runs and runs of other source text
+_CSS_TOKEN_RE = re.compile(r'''
+    (?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+  | (?P<comment>/\*.*?\*/)
+  | (?P<space>\s+)
+  | (?P<code>[^"'/\s]+|["'/])
+''', re.S | re.X)
+
+# Whitespace after these characters, or before the ones that are not ':', separates
+# nothing. Whitespace before ':' is kept, since '.a :hover' differs from '.a:hover'
+_CSS_TIGHT_CHARS = frozenset('{};,>:')
+
+# JavaScript tokens: string and template literals, comments, whitespace runs, a single
+# slash (division or the start of a regex literal) and runs of other source text
+_JS_TOKEN_RE = re.compile(r'''
+    (?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*'|`(?:[^`\\]|\\.)*`)
+  | (?P<comment>/\*.*?\*/|//[^\n]*)
+  | (?P<space>\s+)
+  | (?P<slash>/)
+  | (?P<code>[^"'`/\s]+|["'`])
+''', re.S | re.X)
+
+# Regex literal body and flags, matched from its opening slash
+_JS_REGEX_LITERAL_RE = re.compile(r'/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[a-z]*')
+
+# A slash after one of these characters or keywords starts a regex literal, not a division
+_JS_REGEX_PRECEDING_CHARS = frozenset('(,=:[!&|?{};+-*%<>~^')
+_JS_REGEX_PRECEDING_WORD_RE = re.compile(
+    r'(?:^|[^\w$])(?:return|typeof|case|do|else|in|of|void|new|delete|throw|instanceof)$')
+
+# Whitespace next to these characters is never needed to separate tokens
+_JS_TIGHT_CHARS = frozenset('{}()[];,:=')
+
+
+def _minify_css(css):
+    """
+    Strip comments and collapse whitespace in CSS.
+
+    Quoted strings are copied untouched.
+    """
+    out = []
+    space = False
+    for match in _CSS_TOKEN_RE.finditer(css):
+        kind = match.lastgroup
+        token = match.group(0)
+        if kind == 'comment' or kind == 'space':
+            space = True
+            continue
+        if (space and out and out[-1][-1] not in _CSS_TIGHT_CHARS
+                and (token[0] == ':' or token[0] not in _CSS_TIGHT_CHARS)):
+            out.append(' ')
+        space = False
+        out.append(token)
+    return ''.join(out)
+
+
+def _minify_js(js):
+    """
+    Conservatively minify JavaScript.
+
+    The source is split into tokens so string, template and regex literals are copied
+    untouched. Comments are dropped, whitespace runs collapse to one space (or to nothing
+    next to brackets and separators), and line breaks are kept wherever automatic
+    semicolon insertion could depend on them.
+    """
+    out = []
+    # Whitespace seen since the last emitted token: None, ' ' or '\n'
+    pending = None
+    pos = 0
+    while pos < len(js):
+        match = _JS_TOKEN_RE.match(js, pos)
+        kind = match.lastgroup
+        token = match.group(0)
+        pos = match.end()
+
+        if kind == 'comment' or kind == 'space':
+            if '\n' in token or token.startswith('//'):
+                pending = '\n'
+            elif pending is None:
+                pending = ' '
+            continue
+
+        if kind == 'slash':
+            previous = ''.join(out[-2:]).rstrip()
+            if (not previous or previous[-1] in _JS_REGEX_PRECEDING_CHARS
+                    or _JS_REGEX_PRECEDING_WORD_RE.search(previous)):
+                regex_match = _JS_REGEX_LITERAL_RE.match(js, match.start())
+                if regex_match:
+                    token = regex_match.group(0)
+                    pos = regex_match.end()
+
+        if pending and out:
+            last = out[-1][-1]
+            if pending == '\n' and last not in '{;,' and token[0] != '}':
+                out.append('\n')
+            elif last not in _JS_TIGHT_CHARS and token[0] not in _JS_TIGHT_CHARS:
+                out.append(' ')
+        pending = None
+        out.append(token)
+
+    return ''.join(out)
+
+
+def _generate_grid_row_visibility_css():
+    """
+    Generate CSS hiding grid rows at or beyond the selected row count.
+
+    The grid JavaScript sets data-rows on .grid-container, so changing the row count
+    is a single attribute write instead of a per-row DOM scan.
+    """
+    selectors = ',\n'.join(
+        f'.grid-container[data-rows="{num_rows}"] [data-row="{row}"]'
+        for num_rows in range(1, 16)
+        for row in range(num_rows, 16)
+    )
+    return f'''
+/* Hide grid rows beyond the selected row count */
+{selectors} {{
+    display: none;
+}}
+'''
+
+
 def generate_mesh_control_css():
     """
     Generate CSS for mesh-control-section elements (grid, controls, etc.).
@@ -925,6 +1233,17 @@ def generate_mesh_control_css():
     """
     css = '''
 /* Mesh Control Styles */
+
+/* Theme colors, so the mesh controls can be re-themed by overriding them on :root */
+:root {
+    --c-accent: #667eea;
+    --c-accent-h: #5568d3;
+    --c-accent-a: #4457b8;
+    --c-bg: #f5f5f5;
+    --c-bd: #ddd;
+    --c-text: #666;
+}
+
 .node-count {
     text-align: center;
     margin-bottom: 30px;
@@ -932,14 +1251,14 @@ def generate_mesh_control_css():
 
 .node-count-label {
     font-size: 14px;
-    color: #666;
+    color: var(--c-text);
     margin-bottom: 8px;
 }
 
 .node-count-value {
     font-size: 48px;
     font-weight: bold;
-    color: #667eea;
+    color: var(--c-accent);
     font-family: 'Courier New', monospace;
 }
 
@@ -970,7 +1289,7 @@ def generate_mesh_control_css():
     min-height: 44px;
     font-size: 12px;
     color: #333;
-    background: #f5f5f5;
+    background: var(--c-bg);
     border-radius: 4px;
 }
 
@@ -993,7 +1312,7 @@ def generate_mesh_control_css():
 
 .grid-square {
     aspect-ratio: 1;
-    border: 1px solid #ddd;
+    border: 1px solid var(--c-bd);
     cursor: pointer;
     transition: background-color 0.2s, border 0.2s;
     min-width: 44px;
@@ -1001,7 +1320,7 @@ def generate_mesh_control_css():
 }
 
 .grid-square:hover {
-    border: 2px solid #667eea;
+    border: 2px solid var(--c-accent);
 }
 
 .grid-square:active {
@@ -1024,13 +1343,13 @@ def generate_mesh_control_css():
 .row-count-control label {
     display: block;
     font-size: 14px;
-    color: #666;
+    color: var(--c-text);
     margin-bottom: 8px;
 }
 
 .row-count-control select {
     padding: 8px 12px;
-    border: 2px solid #ddd;
+    border: 2px solid var(--c-bd);
     border-radius: 8px;
     font-size: 16px;
     background: white;
@@ -1039,12 +1358,12 @@ def generate_mesh_control_css():
 }
 
 .row-count-control select:hover {
-    border-color: #667eea;
+    border-color: var(--c-accent);
 }
 
 .row-count-control select:focus {
     outline: none;
-    border-color: #667eea;
+    border-color: var(--c-accent);
     box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
 }
 
@@ -1056,7 +1375,7 @@ def generate_mesh_control_css():
 
 .rhythm-label {
     font-size: 14px;
-    color: #666;
+    color: var(--c-text);
     margin-bottom: 8px;
 }
 
@@ -1068,8 +1387,9 @@ def generate_mesh_control_css():
     margin-bottom: 10px;
 }
 
-#tempoDecrease, #tempoIncrease {
-    background: #667eea;
+/* Shared style for the tempo, sync, sequence control and export/import buttons */
+.mesh-button {
+    background: var(--c-accent);
     color: white;
     border: none;
     padding: 12px 24px;
@@ -1079,29 +1399,32 @@ def generate_mesh_control_css():
     cursor: pointer;
     transition: background-color 0.2s;
     min-height: 44px;
-    min-width: 60px;
 }
 
-#tempoDecrease:hover, #tempoIncrease:hover {
-    background: #5568d3;
+.mesh-button:hover {
+    background: var(--c-accent-h);
 }
 
-#tempoDecrease:active, #tempoIncrease:active {
-    background: #4457b8;
+.mesh-button:active {
+    background: var(--c-accent-a);
 }
 
-#tempoDecrease:disabled, #tempoIncrease:disabled {
+.mesh-button:disabled {
     opacity: 0.5;
     cursor: not-allowed;
 }
 
-#tempoDecrease:disabled:hover, #tempoIncrease:disabled:hover {
-    background: #667eea;
+.mesh-button:disabled:hover {
+    background: var(--c-accent);
+}
+
+#tempoDecrease, #tempoIncrease {
+    min-width: 60px;
 }
 
 #rhythmDisplay {
     font-size: 18px;
-    color: #667eea;
+    color: var(--c-accent);
     font-weight: bold;
     min-width: 80px;
     display: flex;
@@ -1116,31 +1439,8 @@ def generate_mesh_control_css():
 }
 
 #syncButton {
-    background: #667eea;
-    color: white;
-    border: none;
-    padding: 12px 24px;
-    border-radius: 8px;
-    font-size: 16px;
-    font-weight: bold;
-    cursor: pointer;
-    transition: background-color 0.2s;
     width: 100%;
     max-width: 250px;
-    min-height: 44px;
-}
-
-#syncButton:hover {
-    background: #5568d3;
-}
-
-#syncButton:active {
-    background: #4457b8;
-}
-
-#syncButton:disabled {
-    opacity: 0.5;
-    cursor: not-allowed;
 }
 
 #syncFeedback {
@@ -1166,33 +1466,10 @@ def generate_mesh_control_css():
 }
 
 #startButton, #stopButton, #resetButton {
-    background: #667eea;
-    color: white;
-    border: none;
-    padding: 12px 24px;
-    border-radius: 8px;
-    font-size: 16px;
-    font-weight: bold;
-    cursor: pointer;
-    transition: background-color 0.2s;
-    min-height: 44px;
     flex: 1;
     max-width: 150px;
 }
 
-#startButton:hover, #stopButton:hover, #resetButton:hover {
-    background: #5568d3;
-}
-
-#startButton:active, #stopButton:active, #resetButton:active {
-    background: #4457b8;
-}
-
-#startButton:disabled, #stopButton:disabled, #resetButton:disabled {
-    opacity: 0.5;
-    cursor: not-allowed;
-}
-
 #sequenceControlFeedback {
     margin-top: 10px;
     font-size: 14px;
@@ -1215,27 +1492,6 @@ def generate_mesh_control_css():
     margin-top: 10px;
 }
 
-#exportButton, #importButton {
-    background: #667eea;
-    color: white;
-    border: none;
-    padding: 12px 24px;
-    border-radius: 8px;
-    font-size: 16px;
-    font-weight: bold;
-    cursor: pointer;
-    transition: background-color 0.2s;
-    min-height: 44px;
-}
-
-#exportButton:hover, #importButton:hover {
-    background: #5568d3;
-}
-
-#exportButton:active, #importButton:active {
-    background: #4457b8;
-}
-
 #exportContainer, #importContainer {
     margin-top: 20px;
     text-align: center;
@@ -1245,7 +1501,7 @@ def generate_mesh_control_css():
     width: 100%;
     max-width: 600px;
     padding: 12px;
-    border: 2px solid #ddd;
+    border: 2px solid var(--c-bd);
     border-radius: 8px;
     font-family: 'Courier New', monospace;
     font-size: 14px;
@@ -1298,7 +1554,7 @@ def generate_mesh_control_css():
     display: none;
 }
 '''
-    return css
+    return _minify_css(css + _generate_grid_row_visibility_css())
 
 
 def generate_mesh_control_js():
@@ -1312,18 +1568,39 @@ def generate_mesh_control_js():
     - Sequence control button handlers
     - API integration
     """
+    # Row/column label texts (0-9, A-F), emitted as a JS array literal so the grid
+    # doesn't compute them at runtime
+    grid_labels_js = "['" + "','".join(f'{i:X}' for i in range(16)) + "']"
+
     js = '''
 /* Mesh Control JavaScript */
 (function() {
     'use strict';
 
     // Global variables
-    var gridData = new Uint8Array(768);  // 256 squares * 3 channels
+    // 4-bit color channels, one array per channel, indexed by row * 16 + col
+    var gridR = new Uint8Array(256);
+    var gridG = new Uint8Array(256);
+    var gridB = new Uint8Array(256);
     var tempo = 250;
     var numRows = 4;
     var selectedRow = null;
     var selectedCol = null;
     var selectedAction = null;
+    var gridColors = null;  // <style> element holding square colors, cached by initializeGrid()
+    var nodeCountEtag = null;
+    var nodeCountTimer = null;
+    var meshControlInitialized = false;
+
+    // CSS color for every 4-bit-per-channel color, indexed by (r << 8) | (g << 4) | b.
+    // The 3-digit hex form #rgb expands each digit to rr/gg/bb, i.e. exactly channel * 17.
+    var COLOR_LUT = new Array(4096);
+    for (var c = 0; c < 4096; c++) {
+        COLOR_LUT[c] = '#' + (c + 4096).toString(16).slice(1);
+    }
+
+    // Row and column label texts
+    var GRID_LABELS = ''' + grid_labels_js + ''';
 
     // Initialize grid structure
     function initializeGrid() {
@@ -1332,52 +1609,38 @@ def generate_mesh_control_js():
             return;
         }
 
-        // Clear existing content
-        gridContainer.innerHTML = '';
+        // Build the whole grid as one HTML string, so the browser parses and lays it out once
+        var parts = [];
+
+        // Stylesheet holding the square colors, rewritten as a whole by renderGrid()
+        parts.push('<style id="gridColors"></style>');
 
         // Add Z label (top-left corner)
-        var zLabel = document.createElement('div');
-        zLabel.className = 'grid-label grid-label-z';
-        zLabel.textContent = 'Z';
-        zLabel.setAttribute('data-action', 'all');
-        gridContainer.appendChild(zLabel);
+        parts.push('<div class="grid-label grid-label-z" data-action="all">Z</div>');
 
         // Add column labels (0-9, A-F)
         for (var col = 0; col < 16; col++) {
-            var colLabel = document.createElement('div');
-            colLabel.className = 'grid-label grid-label-col';
-            colLabel.setAttribute('data-col', col);
-            if (col < 10) {
-                colLabel.textContent = col.toString();
-            } else {
-                colLabel.textContent = String.fromCharCode(65 + col - 10);  // A-F
-            }
-            gridContainer.appendChild(colLabel);
+            parts.push('<div class="grid-label grid-label-col" data-action="col" data-col="' + col + '">' +
+                GRID_LABELS[col] + '</div>');
         }
 
         // Add row labels and squares
         for (var row = 0; row < 16; row++) {
             // Row label
-            var rowLabel = document.createElement('div');
-            rowLabel.className = 'grid-label grid-label-row';
-            rowLabel.setAttribute('data-row', row);
-            if (row < 10) {
-                rowLabel.textContent = row.toString();
-            } else {
-                rowLabel.textContent = String.fromCharCode(65 + row - 10);  // A-F
-            }
-            gridContainer.appendChild(rowLabel);
+            parts.push('<div class="grid-label grid-label-row" data-action="row" data-row="' + row + '">' +
+                GRID_LABELS[row] + '</div>');
 
             // Grid squares for this row
             for (var col = 0; col < 16; col++) {
-                var square = document.createElement('div');
-                square.className = 'grid-square';
-                square.setAttribute('data-row', row);
-                square.setAttribute('data-col', col);
-                gridContainer.appendChild(square);
+                parts.push('<div class="grid-square" data-action="square" data-row="' + row + '" data-col="' + col +
+                    '" data-idx="' + (row * 16 + col) + '"></div>');
             }
         }
 
+        // Replace existing content in a single assignment
+        gridContainer.innerHTML = parts.join('');
+        gridColors = document.getElementById('gridColors');
+
         // Update grid rows visibility
         updateGridRows();
     }
@@ -1387,53 +1650,50 @@ def generate_mesh_control_js():
         var gridContainer = document.getElementById('gridContainer');
         if (gridContainer) {
             gridContainer.style.gridTemplateRows = 'auto repeat(' + numRows + ', 1fr)';
-        }
-        for (var row = 0; row < 16; row++) {
-            var rowElements = document.querySelectorAll('[data-row="' + row + '"]');
-            if (row < numRows) {
-                rowElements.forEach(function(el) {
-                    el.style.display = '';
-                });
-            } else {
-                rowElements.forEach(function(el) {
-                    el.style.display = 'none';
-                });
-            }
+            // Rows at or beyond numRows are hidden by the generated data-rows CSS rules
+            gridContainer.setAttribute('data-rows', numRows);
         }
         renderGrid();
     }
 
     // Render grid with current colors
+    // All colors go into one stylesheet swap, so the browser restyles the grid once
+    // instead of once per square
     function renderGrid() {
-        var squares = document.querySelectorAll('.grid-square');
-        squares.forEach(function(square) {
-            var row = parseInt(square.getAttribute('data-row'));
-            var col = parseInt(square.getAttribute('data-col'));
-            var color = getSquareColor(row, col);
-            var r8 = color.r * 17;
-            var g8 = color.g * 17;
-            var b8 = color.b * 17;
-            square.style.backgroundColor = 'rgb(' + r8 + ', ' + g8 + ', ' + b8 + ')';
-        });
+        if (!gridColors) {
+            return;
+        }
+        var css = '';
+        for (var i = 0; i < 256; i++) {
+            css += '.grid-square[data-idx="' + i + '"]{background-color:' +
+                COLOR_LUT[(gridR[i] << 8) | (gridG[i] << 4) | gridB[i]] + '}';
+        }
+        gridColors.textContent = css;
     }
 
-    // Get square color from gridData
+    // Get square color from the channel arrays
     function getSquareColor(row, col) {
-        var idx = (row * 16 + col) * 3;
+        var idx = row * 16 + col;
         return {
-            r: gridData[idx] || 0,
-            g: gridData[idx + 1] || 0,
-            b: gridData[idx + 2] || 0
+            r: gridR[idx],
+            g: gridG[idx],
+            b: gridB[idx]
         };
     }
 
-    // Set square color in gridData
-    function setSquareColor(row, col, r, g, b) {
-        var idx = (row * 16 + col) * 3;
-        gridData[idx] = r;
-        gridData[idx + 1] = g;
-        gridData[idx + 2] = b;
-        renderGrid();
+    // Set square color in the channel arrays (without rendering; callers render once when done)
+    function setSquareColorRaw(row, col, r, g, b) {
+        var idx = row * 16 + col;
+        gridR[idx] = r;
+        gridG[idx] = g;
+        gridB[idx] = b;
+    }
+
+    // Set count consecutive squares starting at square index start to one color
+    function fillSquares(start, count, r, g, b) {
+        gridR.fill(r, start, start + count);
+        gridG.fill(g, start, start + count);
+        gridB.fill(b, start, start + count);
     }
 
     // RGB to hex conversion
@@ -1446,12 +1706,20 @@ def generate_mesh_control_js():
 
     // Hex to RGB conversion
     function hexToRgb(hex) {
-        var result = /^#?([a-f\\\\d]{2})([a-f\\\\d]{2})([a-f\\\\d]{2})$/i.exec(hex);
-        return result ? {
-            r: parseInt(result[1], 16),
-            g: parseInt(result[2], 16),
-            b: parseInt(result[3], 16)
-        } : null;
+        // Color inputs always yield '#rrggbb', so parse it as one number and split the channels
+        var h = hex.charCodeAt(0) === 35 ? hex.substr(1) : hex;  // 35 = '#'
+        if (h.length !== 6) {
+            return null;
+        }
+        var n = parseInt(h, 16);
+        if (isNaN(n)) {
+            return null;
+        }
+        return {
+            r: (n >> 16) & 255,
+            g: (n >> 8) & 255,
+            b: n & 255
+        };
     }
 
     // Quantize color to 4-bit (0-15)
@@ -1488,35 +1756,39 @@ def generate_mesh_control_js():
         }
     }
 
-    // Set color based on selected action
+    // Set color based on selected action, then render the grid once
     function applyColor(r, g, b) {
         var quantized = quantizeColor(r, g, b);
         if (selectedAction === 'square') {
-            setSquareColor(selectedRow, selectedCol, quantized.r, quantized.g, quantized.b);
+            setSquareColorRaw(selectedRow, selectedCol, quantized.r, quantized.g, quantized.b);
         } else if (selectedAction === 'row') {
-            for (var col = 0; col < 16; col++) {
-                setSquareColor(selectedRow, col, quantized.r, quantized.g, quantized.b);
-            }
+            fillSquares(selectedRow * 16, 16, quantized.r, quantized.g, quantized.b);
         } else if (selectedAction === 'col') {
             for (var row = 0; row < 16; row++) {
-                setSquareColor(row, selectedCol, quantized.r, quantized.g, quantized.b);
+                setSquareColorRaw(row, selectedCol, quantized.r, quantized.g, quantized.b);
             }
         } else if (selectedAction === 'all') {
-            for (var row = 0; row < 16; row++) {
-                for (var col = 0; col < 16; col++) {
-                    setSquareColor(row, col, quantized.r, quantized.g, quantized.b);
-                }
-            }
+            fillSquares(0, 256, quantized.r, quantized.g, quantized.b);
         }
+        renderGrid();
     }
 
     // Update node count
+    // The server tags the count with an ETag, so an unchanged count comes back as an empty 304
     function updateNodeCount() {
-        fetch('/api/nodes')
+        var headers = nodeCountEtag ? {'If-None-Match': nodeCountEtag} : {};
+        fetch('/api/nodes', {headers: headers})
             .then(function(response) {
+                if (response.status === 304) {
+                    return null;
+                }
+                nodeCountEtag = response.headers.get('ETag');
                 return response.json();
             })
             .then(function(data) {
+                if (!data) {
+                    return;
+                }
                 var nodeCountEl = document.getElementById('nodeCount');
                 if (nodeCountEl) {
                     nodeCountEl.textContent = data.nodes || 0;
@@ -1527,13 +1799,32 @@ def generate_mesh_control_js():
             });
     }
 
+    // Poll node count only while the page is visible
+    function startNodeCountPolling() {
+        if (nodeCountTimer === null) {
+            updateNodeCount();
+            nodeCountTimer = setInterval(updateNodeCount, 5000);
+        }
+    }
+
+    function stopNodeCountPolling() {
+        if (nodeCountTimer !== null) {
+            clearInterval(nodeCountTimer);
+            nodeCountTimer = null;
+        }
+    }
+
     // Initialize on DOM ready
     function initMeshControl() {
-        // Only initialize if mesh-control-section is visible
+        // Only initialize once, and only if mesh-control-section is visible
+        if (meshControlInitialized) {
+            return;
+        }
         var meshControlSection = document.getElementById('mesh-control-section');
         if (!meshControlSection || meshControlSection.style.display === 'none') {
             return;
         }
+        meshControlInitialized = true;
 
         // Initialize grid
         initializeGrid();
@@ -1542,20 +1833,15 @@ def generate_mesh_control_js():
         var gridContainer = document.getElementById('gridContainer');
         if (gridContainer) {
             gridContainer.addEventListener('click', function(e) {
+                // Every clickable grid element carries its action in data-action
                 var target = e.target;
-                if (target.classList.contains('grid-square')) {
-                    var row = parseInt(target.getAttribute('data-row'));
-                    var col = parseInt(target.getAttribute('data-col'));
-                    showColorPicker(row, col, 'square');
-                } else if (target.classList.contains('grid-label-row')) {
-                    var row = parseInt(target.getAttribute('data-row'));
-                    showColorPicker(row, null, 'row');
-                } else if (target.classList.contains('grid-label-col')) {
-                    var col = parseInt(target.getAttribute('data-col'));
-                    showColorPicker(null, col, 'col');
-                } else if (target.classList.contains('grid-label-z')) {
-                    showColorPicker(null, null, 'all');
+                var action = target.getAttribute('data-action');
+                if (!action) {
+                    return;
                 }
+                var row = target.getAttribute('data-row');
+                var col = target.getAttribute('data-col');
+                showColorPicker(row === null ? null : +row, col === null ? null : +col, action);
             });
         }
 
@@ -1579,9 +1865,17 @@ def generate_mesh_control_js():
             });
         }
 
-        // Update node count
-        updateNodeCount();
-        setInterval(updateNodeCount, 5000);
+        // Update node count, pausing while the page is hidden
+        if (document.visibilityState !== 'hidden') {
+            startNodeCountPolling();
+        }
+        document.addEventListener('visibilitychange', function() {
+            if (document.visibilityState === 'hidden') {
+                stopNodeCountPolling();
+            } else {
+                startNodeCountPolling();
+            }
+        });
     }
 
     // Initialize when DOM is ready and sequence is selected
@@ -1600,45 +1894,119 @@ def generate_mesh_control_js():
         setTimeout(checkAndInit, 100);
     }
 
-    // Monitor for mesh-control-section visibility changes
-    var observer = new MutationObserver(function(mutations) {
-        mutations.forEach(function(mutation) {
-            if (mutation.type === 'attributes' && mutation.attributeName === 'style') {
-                var meshControlSection = document.getElementById('mesh-control-section');
-                if (meshControlSection && meshControlSection.style.display === 'block') {
-                    var gridContainer = document.getElementById('gridContainer');
-                    if (gridContainer && gridContainer.children.length === 0) {
-                        initMeshControl();
-                    }
-                }
-            }
-        });
-    });
-
-    // Start observing when DOM is ready
-    if (document.readyState === 'loading') {
-        document.addEventListener('DOMContentLoaded', function() {
-            var meshControlSection = document.getElementById('mesh-control-section');
-            if (meshControlSection) {
-                observer.observe(meshControlSection, { attributes: true, attributeFilter: ['style'] });
-            }
-        });
-    } else {
-        var meshControlSection = document.getElementById('mesh-control-section');
-        if (meshControlSection) {
-            observer.observe(meshControlSection, { attributes: true, attributeFilter: ['style'] });
+    // Initialize when the plugin selector shows mesh-control-section
+    document.addEventListener('plugin:shown', function(e) {
+        if (e.detail && e.detail.name === 'mesh-control') {
+            initMeshControl();
         }
-    }
+    });
 })();
 '''
-    return js
+    return _minify_js(js)
+
+
+# Template placeholder of the form {{NAME}}
+_PLACEHOLDER_RE = re.compile(r'\{\{([A-Z_]+)\}\}')
+
+
+def _split_placeholders(content, values):
+    """
+    Split content on {{NAME}} placeholders and substitute values[NAME] for each one.
+
+    Placeholders without a value are kept as-is. Returns the list of literal and
+    substituted segments, in order, and the set of placeholder names that were replaced.
+    """
+    # A prebuilt page without any placeholders skips the regex scan entirely
+    if '{{' not in content:
+        return [content], set()
+
+    # Splitting on the capturing pattern puts the placeholder names at the odd indices
+    parts = _PLACEHOLDER_RE.split(content)
+    found = set()
+    for index in range(1, len(parts), 2):
+        name = parts[index]
+        if name in values:
+            found.add(name)
+            parts[index] = values[name]
+        else:
+            parts[index] = '{{' + name + '}}'
+    return parts, found
+
+
+def _substitute_placeholders(content, values):
+    """
+    Replace {{NAME}} placeholders in content with values[NAME] in a single pass.
+
+    Placeholders without a value are left as-is. Returns the substituted content and
+    the set of placeholder names that were found and replaced.
+    """
+    parts, found = _split_placeholders(content, values)
+    return ''.join(parts), found
+
+
+# Placeholders of the external page whose content is inserted before a closing tag
+# when the template does not contain them
+_EXTERNAL_FALLBACK_PLACEHOLDERS = frozenset({
+    'PLUGIN_LAYOUT_CSS', 'PLUGIN_CSS', 'PLUGIN_HTML', 'PLUGIN_SELECTION_JS', 'PLUGIN_JS',
+})
+
+
+# Static external page CSS/JS wrapped in their <style>/<script> elements, built once at import
+_LAYOUT_STYLE_BLOCK = f'    <style>{_LAYOUT_CSS}\n    </style>\n'
+_BASIC_UI_STYLE_BLOCK = f'    <style>{_BASIC_UI_CSS}\n    </style>\n'
+_BASIC_UI_SCRIPT_BLOCK = f'    <script>{_BASIC_UI_JS}\n    </script>'
+
+
+def _insert_before_tag(content, tag, insert, separator=''):
+    """
+    Insert text, followed by separator, before the first occurrence of a literal tag.
+
+    Returns the new content, or None if the tag does not occur in content.
+    """
+    index = content.find(tag)
+    if index < 0:
+        return None
+    return ''.join((content[:index], insert, separator, content[index:]))
+
+
+def create_output_dir(output_file):
+    """Create the output file's directory if it doesn't exist."""
+    output_dir = os.path.dirname(output_file)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+
+# Generated C header text before and after the escaped page string literal
+_EMBEDDED_HEADER_PROLOGUE_TEMPLATE = """/* Generated HTML page file
+ *
+ * This file was automatically generated. Do not edit manually.
+ * Template: {template_basename}
+ * Plugins directory: {plugins_basename}
+ *
+ * Copyright (c) 2025 the_louie
+ */
+
+#ifndef {header_guard}
+#define {header_guard}
+
+#include <stddef.h>
+
+/* Embedded HTML page content as C string literal */
+static const char {var_name}[] = \""""
+_EMBEDDED_HEADER_EPILOGUE_TEMPLATE = """\";
+
+#endif /* {header_guard} */
+"""
 
 
-def generate_html_for_embedded(template_file, plugins_dir, output_file):
+def generate_html_for_embedded(template_file, plugins_dir, output_file, plugin_cache=None, minify=False):
     """
     Generate HTML for embedded webserver (C string literal format).
 
     Reads template file, inserts plugin HTML/CSS/JS, and outputs as C string literal.
+    With minify, the built-in layout CSS, selection JS and basic plugin UI CSS/JS are
+    minified as well (the mesh control CSS/JS always is). Plugin sources are embedded
+    as-is.
     """
     # Read template
     template_content = read_file_safe(template_file)
@@ -1647,16 +2015,23 @@ def generate_html_for_embedded(template_file, plugins_dir, output_file):
         return 1
 
     # Collect plugin files
-    plugins = collect_plugin_files(plugins_dir)
+    plugins = collect_plugin_files(plugins_dir, plugin_cache)
+
+    # Read all plugin HTML, CSS and JS files up front
+    plugin_files = read_plugin_files(plugins)
+
+    # Built-in CSS/JS is passed through these before it is added to the page
+    minify_css = _minify_css if minify else (lambda css: css)
+    minify_js = _minify_js if minify else (lambda js: js)
 
     # Generate dropdown HTML
     dropdown_html = generate_dropdown_html(plugins)
 
     # Generate layout CSS
-    layout_css = generate_layout_css()
+    layout_css = minify_css(generate_layout_css())
 
     # Generate selection JavaScript
-    selection_js = generate_selection_js(plugins)
+    selection_js = minify_js(generate_selection_js(plugins))
 
     # Collect plugin CSS and JS content
     plugin_css_content = []
@@ -1670,27 +2045,27 @@ def generate_html_for_embedded(template_file, plugins_dir, output_file):
 
     for plugin in plugins:
         # Read plugin CSS
-        if plugin['css_file']:
-            css_content = read_file_safe(plugin['css_file'])
+        if plugin.css_file:
+            css_content = plugin_files[(plugin.name, 'css')]
             if css_content:
                 # Wrap in comment for identification
-                plugin_css_content.append(f"\n/* Plugin: {plugin['name']} */\n{css_content}")
+                plugin_css_content.append(f"\n/* Plugin: {plugin.name} */\n{css_content}")
 
         # Read plugin JS
-        if plugin['js_file']:
-            js_content = read_file_safe(plugin['js_file'])
+        if plugin.js_file:
+            js_content = plugin_files[(plugin.name, 'js')]
             if js_content:
                 # Wrap in comment for identification
-                plugin_js_content.append(f"\n/* Plugin: {plugin['name']} */\n{js_content}")
+                plugin_js_content.append(f"\n/* Plugin: {plugin.name} */\n{js_content}")
 
         # Read plugin HTML or generate basic UI
-        if plugin['html_file']:
-            html_content = read_file_safe(plugin['html_file'])
+        if plugin.html_file:
+            html_content = plugin_files[(plugin.name, 'html')]
             if html_content:
                 # Wrap in section with plugin class and data attribute
                 # Escape HTML special characters for attribute value
-                plugin_name_escaped = plugin['name'].replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')
-                plugin_html_sections.append(f'<section class="plugin-section plugin-{plugin["name"]}" data-plugin-name="{plugin_name_escaped}">{html_content}</section>')
+                plugin_name_escaped = escape_html_attr(plugin.name)
+                plugin_html_sections.append(f'<section class="plugin-section plugin-{plugin.name}" data-plugin-name="{plugin_name_escaped}">{html_content}</section>')
         else:
             # Plugin without HTML file - will generate basic UI
             plugins_without_html.append(plugin)
@@ -1699,121 +2074,91 @@ def generate_html_for_embedded(template_file, plugins_dir, output_file):
     if plugins_without_html:
         # Generate basic UI CSS (only once)
         if basic_ui_css is None:
-            basic_ui_css = generate_basic_plugin_ui_css()
+            basic_ui_css = minify_css(generate_basic_plugin_ui_css())
             plugin_css_content.append(f"\n/* Basic Plugin UI (shared) */\n{basic_ui_css}")
 
         # Generate basic UI JS (only once)
         if basic_ui_js is None:
-            basic_ui_js = generate_basic_plugin_ui_js()
+            basic_ui_js = minify_js(generate_basic_plugin_ui_js())
             plugin_js_content.append(f"\n/* Basic Plugin UI (shared) */\n{basic_ui_js}")
 
         # Generate basic UI HTML sections for each plugin without HTML
         for plugin in plugins_without_html:
-            basic_ui_html = generate_basic_plugin_ui(plugin['name'])
+            basic_ui_html = generate_basic_plugin_ui(plugin.name)
             # Wrap in section with plugin class and data attribute
-            plugin_name_escaped = plugin['name'].replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')
-            plugin_html_sections.append(f'<section class="plugin-section plugin-{plugin["name"]}" data-plugin-name="{plugin_name_escaped}">{basic_ui_html}</section>')
-
-    # Replace placeholders in template
-    html_content = template_content
-
-    # Replace {{PAGE_TITLE}} placeholder
-    if '{{PAGE_TITLE}}' in html_content:
-        html_content = html_content.replace('{{PAGE_TITLE}}', 'MAKERS JÖNKÖPING LJUSPARAD 2026')
-
-    # Replace {{PLUGIN_DROPDOWN}} placeholder
-    if '{{PLUGIN_DROPDOWN}}' in html_content:
-        html_content = html_content.replace('{{PLUGIN_DROPDOWN}}', dropdown_html)
+            plugin_name_escaped = escape_html_attr(plugin.name)
+            plugin_html_sections.append(f'<section class="plugin-section plugin-{plugin.name}" data-plugin-name="{plugin_name_escaped}">{basic_ui_html}</section>')
 
     # Generate mesh-control CSS and JS
     mesh_control_css = generate_mesh_control_css()
     mesh_control_js = generate_mesh_control_js()
 
-    # Replace {{PLUGIN_LAYOUT_CSS}} placeholder (insert in <style> tag)
-    if '{{PLUGIN_LAYOUT_CSS}}' in html_content:
-        html_content = html_content.replace('{{PLUGIN_LAYOUT_CSS}}', layout_css)
-    elif layout_css:
+    # Join the plugin blocks once; they are used by both the placeholders and the fallbacks
+    css_insert = '\n'.join(plugin_css_content)
+    html_insert = '\n'.join(plugin_html_sections)
+    js_insert = '\n'.join(plugin_js_content)
+
+    # Replace all placeholders in the template in a single pass
+    html_content, found_placeholders = _substitute_placeholders(template_content, {
+        'PAGE_TITLE': 'MAKERS JÖNKÖPING LJUSPARAD 2026',
+        'PLUGIN_DROPDOWN': dropdown_html,
+        'PLUGIN_LAYOUT_CSS': layout_css,
+        'PLUGIN_CSS': css_insert,
+        'PLUGIN_HTML': html_insert,
+        'PLUGIN_SELECTION_JS': selection_js,
+        'PLUGIN_JS': js_insert,
+    })
+
+    # Insert content whose placeholder is missing from the template before the closing tags
+    if 'PLUGIN_LAYOUT_CSS' not in found_placeholders and layout_css:
         # If no placeholder, insert before </style>
-        html_content = re.sub(r'(</style>)', layout_css + r'\n\1', html_content, count=1)
+        html_content = _insert_before_tag(html_content, '</style>', layout_css, '\n') or html_content
 
     # Insert mesh-control CSS before </style>
     if mesh_control_css:
-        html_content = re.sub(r'(</style>)', mesh_control_css + r'\n\1', html_content, count=1)
+        html_content = _insert_before_tag(html_content, '</style>', mesh_control_css, '\n') or html_content
 
-    # Replace {{PLUGIN_CSS}} placeholder (insert before </style>)
-    if '{{PLUGIN_CSS}}' in html_content:
-        css_insert = '\n'.join(plugin_css_content) if plugin_css_content else ''
-        html_content = html_content.replace('{{PLUGIN_CSS}}', css_insert)
-    elif plugin_css_content:
+    if 'PLUGIN_CSS' not in found_placeholders and plugin_css_content:
         # If no placeholder, insert before </style>
-        css_insert = '\n'.join(plugin_css_content)
-        html_content = re.sub(r'(</style>)', css_insert + r'\n\1', html_content, count=1)
-
-    # Replace {{PLUGIN_HTML}} placeholder (insert before closing </div> of container, before </body>)
-    if '{{PLUGIN_HTML}}' in html_content:
-        html_insert = '\n'.join(plugin_html_sections) if plugin_html_sections else ''
-        html_content = html_content.replace('{{PLUGIN_HTML}}', html_insert)
-    elif plugin_html_sections:
+        html_content = _insert_before_tag(html_content, '</style>', css_insert, '\n') or html_content
+
+    if 'PLUGIN_HTML' not in found_placeholders and plugin_html_sections:
         # If no placeholder, insert before </body> but after main content
-        # Try to insert before </div> that closes container, or before </body>
-        html_insert = '\n'.join(plugin_html_sections)
-        # Insert before </body> (safer fallback)
-        html_content = re.sub(r'(</body>)', html_insert + r'\n\1', html_content, count=1)
-
-    # Replace {{PLUGIN_SELECTION_JS}} placeholder (insert before </script>)
-    if '{{PLUGIN_SELECTION_JS}}' in html_content:
-        html_content = html_content.replace('{{PLUGIN_SELECTION_JS}}', selection_js)
-    elif selection_js:
+        html_content = _insert_before_tag(html_content, '</body>', html_insert, '\n') or html_content
+
+    if 'PLUGIN_SELECTION_JS' not in found_placeholders and selection_js:
         # If no placeholder, insert before </script>
-        html_content = re.sub(r'(</script>)', selection_js + r'\n\1', html_content, count=1)
+        html_content = _insert_before_tag(html_content, '</script>', selection_js, '\n') or html_content
 
-    # Replace {{PLUGIN_JS}} placeholder (insert before </script>)
-    if '{{PLUGIN_JS}}' in html_content:
-        js_insert = '\n'.join(plugin_js_content) if plugin_js_content else ''
-        html_content = html_content.replace('{{PLUGIN_JS}}', js_insert)
-    elif plugin_js_content:
+    if 'PLUGIN_JS' not in found_placeholders and plugin_js_content:
         # If no placeholder, insert before </script>
-        js_insert = '\n'.join(plugin_js_content)
-        html_content = re.sub(r'(</script>)', js_insert + r'\n\1', html_content, count=1)
+        html_content = _insert_before_tag(html_content, '</script>', js_insert, '\n') or html_content
 
     # Insert mesh-control JS before </script>
     if mesh_control_js:
-        html_content = re.sub(r'(</script>)', mesh_control_js + r'\n\1', html_content, count=1)
+        html_content = _insert_before_tag(html_content, '</script>', mesh_control_js, '\n') or html_content
 
-    # Escape for C string literal
-    escaped_content = escape_c_string(html_content)
+    # Encode the page once, then escape it for C string literal (lazily, chunk by chunk
+    # as the file is written) so the escaped output never needs encoding itself
+    escaped_chunks = escape_c_bytes_iter(html_content.encode('utf-8'))
 
     # Generate C header file
-    output_dir = os.path.dirname(output_file)
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir, exist_ok=True)
-
-    header_guard = "GENERATED_HTML_PAGE_H"
-    var_name = "html_page"
-
-    header_content = f"""/* Generated HTML page file
- *
- * This file was automatically generated. Do not edit manually.
- * Template: {os.path.basename(template_file)}
- * Plugins directory: {os.path.basename(plugins_dir)}
- *
- * Copyright (c) 2025 the_louie
- */
-
-#ifndef {header_guard}
-#define {header_guard}
-
-#include <stddef.h>
+    create_output_dir(output_file)
 
-/* Embedded HTML page content as C string literal */
-static const char {var_name}[] = "{escaped_content}";
-
-#endif /* {header_guard} */
-"""
+    header_fields = {
+        'template_basename': os.path.basename(template_file),
+        'plugins_basename': os.path.basename(plugins_dir),
+        'header_guard': "GENERATED_HTML_PAGE_H",
+        'var_name': "html_page",
+    }
 
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(header_content)
+        # Write the header prologue, escaped page chunks and epilogue straight to the file
+        # instead of assembling one more full-size copy of the page in memory
+        with open(output_file, 'wb') as f:
+            f.write(_EMBEDDED_HEADER_PROLOGUE_TEMPLATE.format_map(header_fields).encode('utf-8'))
+            f.writelines(escaped_chunks)
+            f.write(_EMBEDDED_HEADER_EPILOGUE_TEMPLATE.format_map(header_fields).encode('utf-8'))
         print(f"Generated: {output_file}")
         return 0
     except Exception as e:
@@ -1821,7 +2166,7 @@ static const char {var_name}[] = "{escaped_content}";
         return 1
 
 
-def generate_html_for_external(template_file, plugins_dir, output_file):
+def generate_html_for_external(template_file, plugins_dir, output_file, plugin_cache=None):
     """
     Generate HTML for external webserver (HTML file format).
 
@@ -1834,7 +2179,10 @@ def generate_html_for_external(template_file, plugins_dir, output_file):
         return 1
 
     # Collect plugin files
-    plugins = collect_plugin_files(plugins_dir)
+    plugins = collect_plugin_files(plugins_dir, plugin_cache)
+
+    # Read plugin HTML files up front (CSS and JS are linked, not inlined)
+    plugin_files = read_plugin_files(plugins, ('html',))
 
     # Generate dropdown HTML
     dropdown_html = generate_dropdown_html(plugins)
@@ -1848,17 +2196,17 @@ def generate_html_for_external(template_file, plugins_dir, output_file):
     # Generate plugin CSS links
     plugin_css_links = []
     for plugin in plugins:
-        if plugin['css_file']:
+        if plugin.css_file:
             # Generate relative path from web-ui root
-            css_path = f"/plugins/{plugin['name']}/css/{plugin['name']}.css"
+            css_path = f"/plugins/{plugin.name}/css/{plugin.name}.css"
             plugin_css_links.append(f'    <link rel="stylesheet" href="{css_path}">')
 
     # Generate plugin JS script tags
     plugin_js_scripts = []
     for plugin in plugins:
-        if plugin['js_file']:
+        if plugin.js_file:
             # Generate relative path from web-ui root
-            js_path = f"/plugins/{plugin['name']}/js/{plugin['name']}.js"
+            js_path = f"/plugins/{plugin.name}/js/{plugin.name}.js"
             plugin_js_scripts.append(f'    <script src="{js_path}"></script>')
 
     # Generate plugin HTML sections (with links to plugin HTML files, or inline if needed)
@@ -1872,13 +2220,13 @@ def generate_html_for_external(template_file, plugins_dir, output_file):
     basic_ui_js = None
 
     for plugin in plugins:
-        if plugin['html_file']:
-            html_content = read_file_safe(plugin['html_file'])
+        if plugin.html_file:
+            html_content = plugin_files[(plugin.name, 'html')]
             if html_content:
                 # Add data-plugin-name attribute
                 # Escape HTML special characters for attribute value
-                plugin_name_escaped = plugin['name'].replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')
-                plugin_html_sections.append(f'    <section class="plugin-section plugin-{plugin["name"]}" data-plugin-name="{plugin_name_escaped}">{html_content}</section>')
+                plugin_name_escaped = escape_html_attr(plugin.name)
+                plugin_html_sections.append(f'    <section class="plugin-section plugin-{plugin.name}" data-plugin-name="{plugin_name_escaped}">{html_content}</section>')
         else:
             # Plugin without HTML file - will generate basic UI
             plugins_without_html.append(plugin)
@@ -1895,88 +2243,79 @@ def generate_html_for_external(template_file, plugins_dir, output_file):
 
         # Generate basic UI HTML sections for each plugin without HTML
         for plugin in plugins_without_html:
-            basic_ui_html = generate_basic_plugin_ui(plugin['name'])
+            basic_ui_html = generate_basic_plugin_ui(plugin.name)
             # Wrap in section with plugin class and data attribute
-            plugin_name_escaped = plugin['name'].replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')
-            plugin_html_sections.append(f'    <section class="plugin-section plugin-{plugin["name"]}" data-plugin-name="{plugin_name_escaped}">{basic_ui_html}</section>')
+            plugin_name_escaped = escape_html_attr(plugin.name)
+            plugin_html_sections.append(f'    <section class="plugin-section plugin-{plugin.name}" data-plugin-name="{plugin_name_escaped}">{basic_ui_html}</section>')
 
     # Replace placeholders in template
     html_content = template_content
 
     # Add basic UI CSS to head if needed (after html_content is set)
     if plugins_without_html and basic_ui_css:
-        if '</head>' in html_content:
-            html_content = re.sub(r'(</head>)', f'    <style>{basic_ui_css}\n    </style>\n\\1', html_content, count=1)
-        elif '</style>' in html_content:
-            html_content = re.sub(r'(</style>)', basic_ui_css + r'\n\1', html_content, count=1)
+        # Each closing tag is searched for only once; the content is left as-is if neither is found
+        html_content = (_insert_before_tag(html_content, '</head>', _BASIC_UI_STYLE_BLOCK)
+                        or _insert_before_tag(html_content, '</style>', basic_ui_css, '\n')
+                        or html_content)
 
     # Add basic UI JS to plugin JS scripts if needed
     if plugins_without_html and basic_ui_js:
-        plugin_js_scripts.append(f'    <script>{basic_ui_js}\n    </script>')
-
-    # Replace {{PAGE_TITLE}} placeholder
-    if '{{PAGE_TITLE}}' in html_content:
-        html_content = html_content.replace('{{PAGE_TITLE}}', 'MAKERS JÖNKÖPING LJUSPARAD 2026')
-
-    # Replace {{PLUGIN_DROPDOWN}} placeholder
-    if '{{PLUGIN_DROPDOWN}}' in html_content:
-        html_content = html_content.replace('{{PLUGIN_DROPDOWN}}', dropdown_html)
-
-    # Replace {{PLUGIN_LAYOUT_CSS}} placeholder (insert in <head> or <style> tag)
-    if '{{PLUGIN_LAYOUT_CSS}}' in html_content:
-        html_content = html_content.replace('{{PLUGIN_LAYOUT_CSS}}', layout_css)
-    elif layout_css:
-        # If no placeholder, try to insert in <head> as <style> tag
-        if '</head>' in html_content:
-            html_content = re.sub(r'(</head>)', f'    <style>{layout_css}\n    </style>\n\\1', html_content, count=1)
-        elif '</style>' in html_content:
-            html_content = re.sub(r'(</style>)', layout_css + r'\n\1', html_content, count=1)
-
-    # Replace {{PLUGIN_CSS}} placeholder (insert in <head> after main CSS)
-    if '{{PLUGIN_CSS}}' in html_content:
-        css_insert = '\n'.join(plugin_css_links) if plugin_css_links else ''
-        html_content = html_content.replace('{{PLUGIN_CSS}}', css_insert)
-    elif plugin_css_links:
-        # If no placeholder, insert before </head>
-        css_insert = '\n'.join(plugin_css_links)
-        html_content = re.sub(r'(</head>)', css_insert + r'\n\1', html_content, count=1)
-
-    # Replace {{PLUGIN_HTML}} placeholder
-    if '{{PLUGIN_HTML}}' in html_content:
-        html_insert = '\n'.join(plugin_html_sections) if plugin_html_sections else ''
-        html_content = html_content.replace('{{PLUGIN_HTML}}', html_insert)
-    elif plugin_html_sections:
-        # If no placeholder, insert before </body> but after main content
-        html_insert = '\n'.join(plugin_html_sections)
-        html_content = re.sub(r'(</body>)', html_insert + r'\n\1', html_content, count=1)
-
-    # Replace {{PLUGIN_SELECTION_JS}} placeholder (insert before </body>)
-    if '{{PLUGIN_SELECTION_JS}}' in html_content:
-        html_content = html_content.replace('{{PLUGIN_SELECTION_JS}}', selection_js)
-    elif selection_js:
-        # If no placeholder, insert as <script> tag before </body>
-        if '</body>' in html_content:
-            html_content = re.sub(r'(</body>)', f'    <script>{selection_js}\n    </script>\n\\1', html_content, count=1)
-        elif '</script>' in html_content:
-            html_content = re.sub(r'(</script>)', selection_js + r'\n\1', html_content, count=1)
-
-    # Replace {{PLUGIN_JS}} placeholder (insert before </body>)
-    if '{{PLUGIN_JS}}' in html_content:
-        js_insert = '\n'.join(plugin_js_scripts) if plugin_js_scripts else ''
-        html_content = html_content.replace('{{PLUGIN_JS}}', js_insert)
-    elif plugin_js_scripts:
-        # If no placeholder, insert before </body>
-        js_insert = '\n'.join(plugin_js_scripts)
-        html_content = re.sub(r'(</body>)', js_insert + r'\n\1', html_content, count=1)
+        plugin_js_scripts.append(_BASIC_UI_SCRIPT_BLOCK)
+
+    # Join the plugin blocks once; they are used by both the placeholders and the fallbacks
+    css_insert = '\n'.join(plugin_css_links)
+    html_insert = '\n'.join(plugin_html_sections)
+    js_insert = '\n'.join(plugin_js_scripts)
+
+    # Replace all placeholders in the template in a single pass
+    html_parts, found_placeholders = _split_placeholders(html_content, {
+        'PAGE_TITLE': 'MAKERS JÖNKÖPING LJUSPARAD 2026',
+        'PLUGIN_DROPDOWN': dropdown_html,
+        'PLUGIN_LAYOUT_CSS': layout_css,
+        'PLUGIN_CSS': css_insert,
+        'PLUGIN_HTML': html_insert,
+        'PLUGIN_SELECTION_JS': selection_js,
+        'PLUGIN_JS': js_insert,
+    })
+
+    # Insert content whose placeholder is missing from the template before the closing tags;
+    # only then is the page joined into one string, otherwise its segments are written as-is
+    if not found_placeholders >= _EXTERNAL_FALLBACK_PLACEHOLDERS:
+        html_content = ''.join(html_parts)
+
+        if 'PLUGIN_LAYOUT_CSS' not in found_placeholders and layout_css:
+            # If no placeholder, try to insert in <head> as <style> tag
+            html_content = (_insert_before_tag(html_content, '</head>', _LAYOUT_STYLE_BLOCK)
+                            or _insert_before_tag(html_content, '</style>', layout_css, '\n')
+                            or html_content)
+
+        if 'PLUGIN_CSS' not in found_placeholders and plugin_css_links:
+            # If no placeholder, insert before </head>
+            html_content = _insert_before_tag(html_content, '</head>', css_insert, '\n') or html_content
+
+        if 'PLUGIN_HTML' not in found_placeholders and plugin_html_sections:
+            # If no placeholder, insert before </body> but after main content
+            html_content = _insert_before_tag(html_content, '</body>', html_insert, '\n') or html_content
+
+        if 'PLUGIN_SELECTION_JS' not in found_placeholders and selection_js:
+            # If no placeholder, insert as <script> tag before </body>
+            html_content = (_insert_before_tag(html_content, '</body>', f'    <script>{selection_js}\n    </script>\n')
+                            or _insert_before_tag(html_content, '</script>', selection_js, '\n')
+                            or html_content)
+
+        if 'PLUGIN_JS' not in found_placeholders and plugin_js_scripts:
+            # If no placeholder, insert before </body>
+            html_content = _insert_before_tag(html_content, '</body>', js_insert, '\n') or html_content
+
+        html_parts = [html_content]
 
     # Write HTML file
-    output_dir = os.path.dirname(output_file)
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir, exist_ok=True)
+    create_output_dir(output_file)
 
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Stream the page segments through a large write buffer instead of joining them first
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            f.writelines(html_parts)
         print(f"Generated: {output_file}")
         return 0
     except Exception as e:
@@ -2005,13 +2344,27 @@ def main():
         'output',
         help='Path to output file'
     )
+    parser.add_argument(
+        '--plugin-cache',
+        metavar='CACHE_FILE',
+        help='Cache plugin discovery results in this file (e.g. build/.plugin_manifest.json) '
+             'and skip rescanning the plugins directory when nothing in it has changed'
+    )
+    parser.add_argument(
+        '--minify',
+        action='store_true',
+        help='Minify the built-in layout, selection and basic plugin UI CSS/JS '
+             '(embedded mode only; the mesh control CSS/JS is always minified, '
+             'plugin sources are never modified)'
+    )
 
     args = parser.parse_args()
 
     if args.mode == 'embedded':
-        return generate_html_for_embedded(args.template, args.plugins_dir, args.output)
+        return generate_html_for_embedded(args.template, args.plugins_dir, args.output, args.plugin_cache,
+                                          args.minify)
     else:  # external
-        return generate_html_for_external(args.template, args.plugins_dir, args.output)
+        return generate_html_for_external(args.template, args.plugins_dir, args.output, args.plugin_cache)
 
 
 if __name__ == '__main__':